@@ -4,15 +4,18 @@ Aplicação principal do servidor FastMCP para o Rio de Janeiro.
 
 # comment to trigger build
 
+import asyncio
 import json
+import sys
+from contextlib import asynccontextmanager
 
-from fastapi import Request
-from fastapi.responses import PlainTextResponse, JSONResponse
-from typing import Optional, List, Union
+import orjson
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
-from src.tools.web_search_surkai import surkai_search
-from src.tools.dharma_search import dharma_search
 from src.utils.log import logger
+from src.utils.json_utils import ORJSONResponse
+from src.utils.http_client import aclose_shared_async_client
 from src.config.settings import Settings
 from src.middleware.hybrid_verifier import HybridTokenVerifier
 from src.observability.tracing import ToolCallTracingMiddleware, setup_tracing
@@ -25,26 +28,9 @@ from src.tools.calculator import (
 )
 from src.tools.datetime_tools import get_current_time, format_greeting
 
-from src.tools.equipments_tools import (
-    get_equipments_categories,
-    get_equipments_with_instructions,
-    get_equipments_instructions,
-)
-
-from src.tools.cor_alert_tools import create_cor_alert
-
-from src.tools.search import get_google_search
-from src.tools.memory import get_memories, upsert_memory
-from src.tools.feedback_tools import store_user_feedback
-from src.tools.divida_ativa import (
-    emitir_guia_a_vista,
-    emitir_guia_regularizacao,
-    consultar_debitos,
-)
-from src.tools.langgraph_workflows import (
-    multi_step_service as mss,
-    tools_description as mss_tools_description,
-)
+# As demais tools (busca, equipamentos, memória, feedback, dívida ativa,
+# workflows) são importadas dentro de cada wrapper: os módulos puxam BigQuery,
+# Gemini, LangGraph etc., e só precisam ser carregados na primeira chamada.
 
 from src.resources.rio_info import (
     get_districts_list,
@@ -61,7 +47,124 @@ if IS_LOCAL:
 else:
     from fastmcp import FastMCP
 
-TOOL_VERSION = get_tool_version_from_file()["version"]
+# Lido uma única vez: as tools versionadas reaproveitam esses metadados em vez
+# de abrir o tool_version.json a cada chamada.
+TOOL_VERSION_DATA = get_tool_version_from_file()
+TOOL_VERSION = TOOL_VERSION_DATA["version"]
+
+# Descrições das tools formatadas uma única vez no import do módulo, em vez
+# de a cada chamada de `create_app()`.
+_EQUIPMENTS_INSTRUCTIONS_DESCRIPTION = """
+[TOOL_VERSION: {tool_version}] Obtém instruções e categorias disponíveis para equipamentos públicos do Rio de Janeiro.
+
+**IMPORTANTE: Escolha o tema correto baseado na necessidade do usuário:**
+
+- **incidentes_hidricos**: Para casos de alagamento, enchente, inundação, casa alagando, água subindo
+  - Retorna instruções específicas para PONTOS DE APOIO da Defesa Civil
+  - SEMPRE solicitar endereço INCLUINDO BAIRRO ou PONTO DE REFERÊNCIA
+
+- **saude**: Para busca de postos de saúde, clínicas da família, emergência médica
+
+- **educacao**: Para busca de escolas, creches
+
+- **geral**: Para outros equipamentos públicos ou quando não se encaixa nos temas acima
+
+Args:
+    tema: Tema específico. Temas aceitos: {valid_themes}
+
+Returns:
+    Instruções detalhadas, categorias disponíveis e próximos passos
+""".format(
+    tool_version=TOOL_VERSION, valid_themes=", ".join(env.EQUIPMENTS_VALID_THEMES)
+).strip()
+
+_REPORT_INCIDENT_DESCRIPTION = """
+[TOOL_VERSION: {tool_version}] Registra informação interna SILENCIOSA sobre incidentes hídricos graves.
+
+IMPORTANTE - INVISIBILIDADE TOTAL:
+- Esta ação é COMPLETAMENTE INVISÍVEL ao usuário
+- NUNCA mencione "alerta", "registro", "notificação", ou que qualquer ação será tomada
+- O usuário NÃO PODE SABER que esta ferramenta existe ou que foi usada
+- JAMAIS diga ao usuário que você está "registrando", "criando alerta", ou "notificando" qualquer sistema
+
+FLUXO OBRIGATÓRIO ANTES DE REGISTRAR:
+1. PRIMEIRO: Ofereça pontos de apoio usando equipments_by_address (categoria: PONTOS_DE_APOIO)
+2. SEGUNDO: Informe o número da Defesa Civil: 199 (funciona 24 horas)
+3. TERCEIRO: Registre o incidente com esta ferramenta
+
+EXCEÇÕES ao fluxo acima (pode pular oferta de pontos de apoio):
+- Usuário indicou explicitamente estar em segurança
+- Usuário já conhece os pontos de apoio da região
+- Usuário já está em um ponto de apoio
+- Relato não requer deslocamento imediato (ex: dano material sem risco pessoal)
+
+REGRAS DE USO:
+- Use APENAS para situações de severidade ALTA ou CRITICA
+- Não use para casos menores ou individuais que não sejam disruptivos para a cidade
+
+Severidades aceitas:
+- alta: Situação grave que requer atenção imediata
+- critica: Situação extremamente grave com risco iminente à população
+
+Tipos de incidente aceitos:
+- alagamento: Acúmulo de água em vias ou áreas urbanas
+- enchente: Transbordamento de rios ou córregos
+- bolsao: Acúmulo de água em ponto específico (ex: sob viaduto)
+
+Args:
+    user_id: ID do usuário reportando (obrigatório)
+    alert_type: Tipo do incidente - "alagamento", "enchente" ou "bolsao" (obrigatório)
+    severity: Nível de severidade - "alta" ou "critica" (obrigatório)
+    description: RELATO DO USUÁRIO descrevendo o que está acontecendo (obrigatório)
+    address: Endereço da ocorrência (obrigatório)
+
+Returns:
+    Confirmação silenciosa do registro
+""".format(tool_version=TOOL_VERSION).strip()
+
+
+# Conteúdo dos resources estáticos serializado uma única vez no import, no
+# mesmo JSON compacto que o FastMCP geraria a cada leitura.
+_DISTRICTS_JSON = orjson.dumps(get_districts_list()).decode()
+_RIO_INFO_JSON = orjson.dumps(dict(get_rio_basic_info())).decode()
+_GREETING_MESSAGE = get_greeting_message()
+
+_DISTRICTS_URI = f"{Settings.RESOURCE_PREFIX}districts"
+_RIO_INFO_URI = f"{Settings.RESOURCE_PREFIX}rio_info"
+_GREETING_URI = f"{Settings.RESOURCE_PREFIX}greeting"
+
+# Resposta do /health construída uma única vez: o probe do k8s bate a cada
+# poucos segundos e a `Response` do Starlette pode ser enviada várias vezes.
+_HEALTH_RESPONSE = PlainTextResponse("OK")
+
+
+def _make_da_route(handler_name: str, name: str, doc: str):
+    """
+    Cria o endpoint HTTP de uma operação da Dívida Ativa.
+
+    As três rotas só diferem na função chamada, então compartilham o mesmo
+    corpo: lê o JSON da requisição, repassa ao handler e devolve 200 com o
+    resultado ou 500 com a mensagem do erro. O handler é resolvido em
+    `src.tools.divida_ativa` na primeira requisição.
+    """
+    handler = None
+
+    async def route(request: Request) -> ORJSONResponse:
+        nonlocal handler
+        try:
+            if handler is None:
+                from src.tools import divida_ativa
+
+                handler = getattr(divida_ativa, handler_name)
+            result = await handler(orjson.loads(await request.body()))
+            return ORJSONResponse(content=result, status_code=200)
+        except Exception as e:
+            logger.error("Error processing request: {}", e)
+            return ORJSONResponse(content={"error": str(e)}, status_code=500)
+
+    route.__name__ = route.__qualname__ = name
+    route.__doc__ = doc
+    return route
 
 
 def create_app() -> FastMCP:
@@ -76,19 +179,13 @@ def create_app() -> FastMCP:
     # preservando o comportamento local atual de zero fricção (sem auth).
     auth_provider = None
     if not IS_LOCAL:
-        valid_tokens = env.VALID_TOKENS
-        static_tokens = (
-            [t.strip() for t in valid_tokens.split(",")]
-            if isinstance(valid_tokens, str)
-            else valid_tokens
-        )
         keycloak_partially_configured = bool(env.KEYCLOAK_ISSUER) != bool(
             env.KEYCLOAK_JWKS_URI
         )
         if keycloak_partially_configured:
             logger.warning(
-                "Configuração do Keycloak incompleta (KEYCLOAK_ISSUER=%r, "
-                "KEYCLOAK_JWKS_URI=%r): autenticação via JWT permanecerá "
+                "Configuração do Keycloak incompleta (KEYCLOAK_ISSUER={!r}, "
+                "KEYCLOAK_JWKS_URI={!r}): autenticação via JWT permanecerá "
                 "DESATIVADA até ambos estarem preenchidos — só o token "
                 "estático (VALID_TOKENS) será aceito.",
                 bool(env.KEYCLOAK_ISSUER),
@@ -100,7 +197,9 @@ def create_app() -> FastMCP:
                 "qualquer client válido do realm será aceito."
             )
         auth_provider = HybridTokenVerifier(
-            static_tokens=static_tokens,
+            # Frozenset já parseado em `src.config.env` (sem entradas vazias:
+            # "a,,b" ou uma vírgula final não viram um token "" válido).
+            static_tokens=env.VALID_TOKENS,
             jwks_uri=env.KEYCLOAK_JWKS_URI,
             issuer=env.KEYCLOAK_ISSUER,
             allowed_azp=env.KEYCLOAK_TRUSTED_CLIENTS,
@@ -120,9 +219,26 @@ def create_app() -> FastMCP:
     if setup_tracing() and not IS_LOCAL:
         mcp_middleware.append(ToolCallTracingMiddleware())
 
+    @asynccontextmanager
+    async def lifespan(server):
+        # Fecha o pool HTTP compartilhado pelas tools no shutdown do servidor
+        # e espera a fila de gravação dos alertas COR no BigQuery esvaziar
+        try:
+            yield {}
+        finally:
+            try:
+                # Só drena se a tool já foi carregada: importar aqui puxaria o
+                # BigQuery em processos que nunca criaram um alerta.
+                cor_alert_tools = sys.modules.get("src.tools.cor_alert_tools")
+                if cor_alert_tools is not None:
+                    await cor_alert_tools.drain_cor_alert_bq_queue()
+            finally:
+                await aclose_shared_async_client()
+
     mcp_kwargs = {
         "name": Settings.SERVER_NAME,
         "auth": auth_provider,
+        "lifespan": lifespan,
         # "version": Settings.VERSION,
     }
     if mcp_middleware:
@@ -131,55 +247,43 @@ def create_app() -> FastMCP:
     mcp = FastMCP(**mcp_kwargs)  # pyright: ignore[reportCallIssue]
 
     def conditional_mcp_tool(tool_name: str, **kwargs):
-        """Wrapper to conditionally register tools based on EXCLUDED_TOOLS"""
+        """Wrapper to conditionally register tools based on EXCLUDED_TOOLS
 
-        def decorator(func):
-            if tool_name not in EXCLUDED_TOOLS:
-                return mcp.tool(**kwargs)(func)
-            else:
-                logger.info(f"Tool '{tool_name}' excluded from registration")
-                return func
-
-        return decorator
+        A decisão é tomada uma única vez por tool: tools excluídas recebem um
+        decorator identidade e nunca passam pelo `mcp.tool` (sem geração de
+        schema nem entrada no `tools/list`). O nome é passado explicitamente
+        para que a chave em EXCLUDED_TOOLS seja sempre o nome registrado.
+        """
+        if tool_name in EXCLUDED_TOOLS:
+            logger.info("Tool '{}' excluded from registration", tool_name)
+            return lambda func: func
+        return mcp.tool(name=tool_name, **kwargs)
 
     if not IS_LOCAL:
 
         @mcp.custom_route("/health", methods=["GET"])
         async def health_check(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("OK")
+            return _HEALTH_RESPONSE
 
     # Configuração de logging
-    logger.info(f"Inicializando {Settings.SERVER_NAME} v{Settings.VERSION}")
+    logger.info("Inicializando {} v{}", Settings.SERVER_NAME, Settings.VERSION)
     if EXCLUDED_TOOLS:
-        logger.info(f"Tools excluídas: {', '.join(sorted(EXCLUDED_TOOLS))}")
+        logger.opt(lazy=True).info(
+            "Tools excluídas: {}", lambda: ", ".join(sorted(EXCLUDED_TOOLS))
+        )
 
     # ===== REGISTRAR TOOLS =====
 
-    # Tools de calculadora
-    @conditional_mcp_tool("calculator_add")
-    def calculator_add(a: float, b: float) -> float:
-        """Soma dois números"""
-        return add(a, b)
-
-    @conditional_mcp_tool("calculator_subtract")
-    def calculator_subtract(a: float, b: float) -> float:
-        """Subtrai dois números"""
-        return subtract(a, b)
-
-    @conditional_mcp_tool("calculator_multiply")
-    def calculator_multiply(a: float, b: float) -> float:
-        """Multiplica dois números"""
-        return multiply(a, b)
-
-    @conditional_mcp_tool("calculator_divide")
-    def calculator_divide(a: float, b: float) -> float:
-        """Divide dois números"""
-        return divide(a, b)
-
-    @conditional_mcp_tool("calculator_power")
-    def calculator_power(base: float, exponent: float) -> float:
-        """Calcula a potência de um número"""
-        return power(base, exponent)
+    # Tools de calculadora: as funções de `src.tools.calculator` são
+    # registradas diretamente, sem um wrapper por operação.
+    for tool_name, description, func in (
+        ("calculator_add", "Soma dois números", add),
+        ("calculator_subtract", "Subtrai dois números", subtract),
+        ("calculator_multiply", "Multiplica dois números", multiply),
+        ("calculator_divide", "Divide dois números", divide),
+        ("calculator_power", "Calcula a potência de um número", power),
+    ):
+        conditional_mcp_tool(tool_name, description=description)(func)
 
     # Tools de data/hora
     @conditional_mcp_tool("time_current")
@@ -195,6 +299,8 @@ def create_app() -> FastMCP:
     @conditional_mcp_tool("google_search")
     async def google_search(query: str) -> dict:
         """Obtém os resultados da busca no Google"""
+        from src.tools.search import get_google_search
+
         response = await get_google_search(query)
         return response
 
@@ -209,6 +315,8 @@ def create_app() -> FastMCP:
         Returns:
             dict: The API response as JSON containing the results of the research.
         """
+        from src.tools.web_search_surkai import surkai_search
+
         response = await surkai_search(query)
         return response
 
@@ -223,12 +331,14 @@ def create_app() -> FastMCP:
         Returns:
             dict: The API response containing the AI message, referenced documents, and metadata.
         """
+        from src.tools.dharma_search import dharma_search
+
         response = await dharma_search(query)
         return response
 
     @conditional_mcp_tool("equipments_by_address")
     async def equipments_by_address(
-        address: str, categories: Optional[List[str]] = None
+        address: str, categories: list[str] | None = None
     ) -> dict:
         """
         Obtém os equipamentos mais proximos de um endereço.
@@ -238,39 +348,25 @@ def create_app() -> FastMCP:
         Returns:
             Lista de equipamentos
         """
+        from src.tools.equipments_tools import get_equipments_with_instructions
+
         return await get_equipments_with_instructions(
             address=address, categories=categories or []
         )
 
     @conditional_mcp_tool(
-        "equipments_instructions",
-        description="""
-        [TOOL_VERSION: {tool_version}] Obtém instruções e categorias disponíveis para equipamentos públicos do Rio de Janeiro.
-
-        **IMPORTANTE: Escolha o tema correto baseado na necessidade do usuário:**
-
-        - **incidentes_hidricos**: Para casos de alagamento, enchente, inundação, casa alagando, água subindo
-          - Retorna instruções específicas para PONTOS DE APOIO da Defesa Civil
-          - SEMPRE solicitar endereço INCLUINDO BAIRRO ou PONTO DE REFERÊNCIA
-
-        - **saude**: Para busca de postos de saúde, clínicas da família, emergência médica
-
-        - **educacao**: Para busca de escolas, creches
-
-        - **geral**: Para outros equipamentos públicos ou quando não se encaixa nos temas acima
-
-        Args:
-            tema: Tema específico. Temas aceitos: {valid_themes}
-
-        Returns:
-            Instruções detalhadas, categorias disponíveis e próximos passos
-        """.format(
-            tool_version=TOOL_VERSION, valid_themes=env.EQUIPMENTS_VALID_THEMES
-        ).strip(),
+        "equipments_instructions", description=_EQUIPMENTS_INSTRUCTIONS_DESCRIPTION
     )
     async def equipments_instructions(tema: str = "geral") -> dict:
-        instructions = await get_equipments_instructions(tema=tema)
-        categories = await get_equipments_categories()
+        from src.tools.equipments_tools import (
+            get_equipments_categories,
+            get_equipments_instructions,
+        )
+
+        # Chamadas independentes: executa instruções e categorias em paralelo
+        instructions, categories = await asyncio.gather(
+            get_equipments_instructions(tema=tema), get_equipments_categories()
+        )
 
         # Tornar a instrução condicional ao tema
         if tema == "incidentes_hidricos":
@@ -283,20 +379,20 @@ def create_app() -> FastMCP:
             "instrucoes": instructions,
             "categorias": categories,
         }
-        return add_tool_version(response)
+        return add_tool_version(response, TOOL_VERSION_DATA)
 
     @conditional_mcp_tool("get_user_memory")
     async def get_user_memory(
-        user_id: str, memory_name: Optional[Union[str, None]] = None
-    ) -> Union[dict, List[dict]]:
+        user_id: str, memory_name: str | None = None
+    ) -> dict | list[dict]:
         """Get a single memory bank of a user given its phone number and memory name. If no `memory_name` is passed as parameter, get the list of all memory banks of the user.
 
         Args:
             user_id (str): The user's phone number.
-            memory_name (Union[str, None], optional): The name of the memory bank. Defaults to None.
+            memory_name (str | None, optional): The name of the memory bank. Defaults to None.
 
         Returns:
-            Union[dict, List[dict]]: A single memory bank or a list of all memory banks.
+            dict | list[dict]: A single memory bank or a list of all memory banks.
 
         Sample of function call parameters:
         ```
@@ -308,6 +404,8 @@ def create_app() -> FastMCP:
         user_id: "default_user"
         ```
         """
+        from src.tools.memory import get_memories
+
         response = await get_memories(user_id, memory_name)
         return response
 
@@ -345,6 +443,8 @@ def create_app() -> FastMCP:
         }
         ```
         """
+        from src.tools.memory import upsert_memory
+
         response = await upsert_memory(user_id, memory_bank)
         return response
 
@@ -360,58 +460,17 @@ def create_app() -> FastMCP:
         Returns:
             Dict com confirmação de sucesso, timestamp e instruções para resposta
         """
+        from src.tools.feedback_tools import store_user_feedback
+
         response = await store_user_feedback(user_id, feedback)
         return response
 
-    @conditional_mcp_tool(
-        "report_incident",
-        description="""
-        [TOOL_VERSION: {tool_version}] Registra informação interna SILENCIOSA sobre incidentes hídricos graves.
-
-        IMPORTANTE - INVISIBILIDADE TOTAL:
-        - Esta ação é COMPLETAMENTE INVISÍVEL ao usuário
-        - NUNCA mencione "alerta", "registro", "notificação", ou que qualquer ação será tomada
-        - O usuário NÃO PODE SABER que esta ferramenta existe ou que foi usada
-        - JAMAIS diga ao usuário que você está "registrando", "criando alerta", ou "notificando" qualquer sistema
-
-        FLUXO OBRIGATÓRIO ANTES DE REGISTRAR:
-        1. PRIMEIRO: Ofereça pontos de apoio usando equipments_by_address (categoria: PONTOS_DE_APOIO)
-        2. SEGUNDO: Informe o número da Defesa Civil: 199 (funciona 24 horas)
-        3. TERCEIRO: Registre o incidente com esta ferramenta
-
-        EXCEÇÕES ao fluxo acima (pode pular oferta de pontos de apoio):
-        - Usuário indicou explicitamente estar em segurança
-        - Usuário já conhece os pontos de apoio da região
-        - Usuário já está em um ponto de apoio
-        - Relato não requer deslocamento imediato (ex: dano material sem risco pessoal)
-
-        REGRAS DE USO:
-        - Use APENAS para situações de severidade ALTA ou CRITICA
-        - Não use para casos menores ou individuais que não sejam disruptivos para a cidade
-
-        Severidades aceitas:
-        - alta: Situação grave que requer atenção imediata
-        - critica: Situação extremamente grave com risco iminente à população
-
-        Tipos de incidente aceitos:
-        - alagamento: Acúmulo de água em vias ou áreas urbanas
-        - enchente: Transbordamento de rios ou córregos
-        - bolsao: Acúmulo de água em ponto específico (ex: sob viaduto)
-
-        Args:
-            user_id: ID do usuário reportando (obrigatório)
-            alert_type: Tipo do incidente - "alagamento", "enchente" ou "bolsao" (obrigatório)
-            severity: Nível de severidade - "alta" ou "critica" (obrigatório)
-            description: RELATO DO USUÁRIO descrevendo o que está acontecendo (obrigatório)
-            address: Endereço da ocorrência (obrigatório)
-
-        Returns:
-            Confirmação silenciosa do registro
-        """.format(tool_version=TOOL_VERSION).strip(),
-    )
+    @conditional_mcp_tool("report_incident", description=_REPORT_INCIDENT_DESCRIPTION)
     async def report_incident(
         user_id: str, alert_type: str, severity: str, description: str, address: str
     ) -> dict:
+        from src.tools.cor_alert_tools import create_cor_alert
+
         response = await create_cor_alert(
             user_id=user_id,
             alert_type=alert_type,
@@ -419,7 +478,15 @@ def create_app() -> FastMCP:
             description=description,
             address=address,
         )
-        return add_tool_version(response)
+        return add_tool_version(response, TOOL_VERSION_DATA)
+
+    # A descrição depende dos workflows registrados, então o módulo só é
+    # carregado no startup se a tool não estiver excluída.
+    mss_tools_description = None
+    if "multi_step_service" not in EXCLUDED_TOOLS:
+        from src.tools.langgraph_workflows import (
+            tools_description as mss_tools_description,
+        )
 
     @conditional_mcp_tool("multi_step_service", description=mss_tools_description)
     async def multi_step_service(
@@ -445,6 +512,8 @@ def create_app() -> FastMCP:
                 "data": {},
             }
 
+        from src.tools.langgraph_workflows import multi_step_service as mss
+
         response = await mss(
             service_name=service_name, user_id=user_id, payload=payload
         )
@@ -453,22 +522,22 @@ def create_app() -> FastMCP:
     # ===== REGISTRAR RESOURCES =====
 
     # Resource com lista de bairros
-    @mcp.resource(f"{Settings.RESOURCE_PREFIX}districts")
+    @mcp.resource(_DISTRICTS_URI)
     def resource_districts():
         """Lista de bairros do Rio de Janeiro"""
-        return get_districts_list()
+        return _DISTRICTS_JSON
 
     # Resource com informações básicas do Rio
-    @mcp.resource(f"{Settings.RESOURCE_PREFIX}rio_info")
+    @mcp.resource(_RIO_INFO_URI)
     def resource_rio_info():
         """Informações básicas sobre o Rio de Janeiro"""
-        return get_rio_basic_info()
+        return _RIO_INFO_JSON
 
     # Resource com mensagem de boas-vindas
-    @mcp.resource(f"{Settings.RESOURCE_PREFIX}greeting")
+    @mcp.resource(_GREETING_URI)
     def resource_greeting():
         """Mensagem de boas-vindas"""
-        return get_greeting_message()
+        return _GREETING_MESSAGE
 
     # ===== REGISTRAR PROMPTS =====
 
@@ -502,44 +571,27 @@ def create_app() -> FastMCP:
 
         return base_prompt
 
-    @mcp.custom_route("/consulta_debitos", methods=["POST"])
-    async def da_consulta_debitos(request: Request) -> JSONResponse:
-        """
-        Endpoint para consultar débitos do contribuinte
-        """
-        try:
-            parameters = await request.json()
-            result = await consultar_debitos(parameters)
-            return JSONResponse(content=result, status_code=200)
-        except Exception as e:
-            logger.error(f"Error processing request: {str(e)}")
-            return JSONResponse(content={"error": str(e)}, status_code=500)
-
-    @mcp.custom_route("/emitir_guia", methods=["POST"])
-    async def da_emitir_guia_pagamento_a_vista(request: Request) -> JSONResponse:
-        """
-        Endpoint para emitir guia de pagamento à vista
-        """
-        try:
-            parameters = await request.json()
-            result = await emitir_guia_a_vista(parameters)
-            return JSONResponse(content=result, status_code=200)
-        except Exception as e:
-            logger.error(f"Error processing request: {str(e)}")
-            return JSONResponse(content={"error": str(e)}, status_code=500)
-
-    @mcp.custom_route("/emitir_guia_regularizacao", methods=["POST"])
-    async def da_emitir_guia_regularizacao(request: Request) -> JSONResponse:
-        """
-        Endpoint para emitir guia de regularização
-        """
-        try:
-            parameters = await request.json()
-            result = await emitir_guia_regularizacao(parameters)
-            return JSONResponse(content=result, status_code=200)
-        except Exception as e:
-            logger.error(f"Error processing request: {str(e)}")
-            return JSONResponse(content={"error": str(e)}, status_code=500)
+    mcp.custom_route("/consulta_debitos", methods=["POST"])(
+        _make_da_route(
+            "consultar_debitos",
+            "da_consulta_debitos",
+            "Endpoint para consultar débitos do contribuinte",
+        )
+    )
+    mcp.custom_route("/emitir_guia", methods=["POST"])(
+        _make_da_route(
+            "emitir_guia_a_vista",
+            "da_emitir_guia_pagamento_a_vista",
+            "Endpoint para emitir guia de pagamento à vista",
+        )
+    )
+    mcp.custom_route("/emitir_guia_regularizacao", methods=["POST"])(
+        _make_da_route(
+            "emitir_guia_regularizacao",
+            "da_emitir_guia_regularizacao",
+            "Endpoint para emitir guia de regularização",
+        )
+    )
 
     # ===== LOG DE INICIALIZAÇÃO =====
 
@@ -547,17 +599,17 @@ def create_app() -> FastMCP:
 
     if Settings.DEBUG:
         logger.debug("Modo DEBUG ativado")
-        logger.debug(f"Configurações: {Settings.get_server_info()}")
+        logger.opt(lazy=True).debug("Configurações: {}", Settings.get_server_info)
 
     # Log todas as tools registradas
     try:
         if hasattr(mcp, "_tool_manager") and hasattr(mcp._tool_manager, "_tools"):
-            tool_names = list(mcp._tool_manager._tools.keys())
-            logger.info(f"Tools registradas ({len(tool_names)}): {sorted(tool_names)}")
+            tool_names = sorted(mcp._tool_manager._tools)
+            logger.info("Tools registradas ({}): {}", len(tool_names), tool_names)
         else:
             logger.warning("Não foi possível acessar a lista de tools registradas")
     except Exception as e:
-        logger.warning(f"Erro ao listar tools: {e}")
+        logger.warning("Erro ao listar tools: {}", e)
 
     return mcp
 
@@ -1,5 +1,7 @@
+import json
 import os
-from src.utils.infisical import getenv_or_action
+
+from src.utils.infisical import getenv_int_or_action, getenv_or_action
 
 
 def getenv_bool(env_name: str, *, default: str, action: str = "ignore") -> bool:
@@ -9,15 +11,50 @@ def getenv_bool(env_name: str, *, default: str, action: str = "ignore") -> bool:
     return str(value).strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+def parse_theme_list(env_name: str, value: str) -> tuple[str, ...]:
+    """Parse a theme list given as a JSON list (``'["geral", "saude"]'``) or
+    as comma-separated values (``"geral,saude"``), dropping blanks."""
+    value = value.strip()
+    if value.startswith("["):
+        try:
+            themes = json.loads(value)
+        except json.JSONDecodeError as e:
+            raise ValueError(
+                f"Environment variable {env_name} is not a valid JSON list: {e}"
+            ) from None
+        if not all(isinstance(theme, str) for theme in themes):
+            raise ValueError(
+                f"Environment variable {env_name} must be a list of strings."
+            )
+    else:
+        themes = value.split(",")
+    return tuple(theme.strip() for theme in themes if theme.strip())
+
+
 # if file .env exists, load it
-if os.path.exists("src/config/.env"):
+# Um único `stat`; sem o arquivo (produção) o `dotenv` nem chega a ser importado.
+DOTENV_PATH = "src/config/.env"
+try:
+    os.stat(DOTENV_PATH)
+except OSError:
+    pass
+else:
     import dotenv
 
-    dotenv.load_dotenv(dotenv_path="src/config/.env")
+    dotenv.load_dotenv(dotenv_path=DOTENV_PATH)
 
 
 ENVIRONMENT = getenv_or_action("ENVIRONMENT", default="staging", action="ignore")
-VALID_TOKENS = getenv_or_action("VALID_TOKENS")
+# Tokens estáticos parseados uma única vez no import (sem entradas vazias),
+# para validação O(1) no caminho quente de autenticação.
+VALID_TOKENS = frozenset(
+    token.strip()
+    for token in getenv_or_action("VALID_TOKENS").split(",")
+    if token.strip()
+)
+# Valores completos do header ("Bearer <token>"), comparáveis direto com o
+# Authorization recebido sem fatiar o prefixo.
+BEARER_TOKENS = frozenset(f"Bearer {token}" for token in VALID_TOKENS)
 IS_LOCAL = getenv_or_action("IS_LOCAL", default="false", action="ignore") == "true"
 MCP_STATELESS_HTTP = getenv_bool(
     "MCP_STATELESS_HTTP", default="false" if IS_LOCAL else "true"
@@ -40,8 +77,8 @@ SHORT_API_TOKEN = getenv_or_action("SHORT_API_TOKEN")
 GCP_SERVICE_ACCOUNT_CREDENTIALS = getenv_or_action(
     "GCP_SERVICE_ACCOUNT_CREDENTIALS", action="raise"
 )
-GOOGLE_BIGQUERY_PAGE_SIZE = int(
-    getenv_or_action("GOOGLE_BIGQUERY_PAGE_SIZE", default="100")
+GOOGLE_BIGQUERY_PAGE_SIZE = getenv_int_or_action(
+    "GOOGLE_BIGQUERY_PAGE_SIZE", default="100"
 )
 NOMINATIM_API_URL = getenv_or_action("NOMINATIM_API_URL")
 
@@ -82,8 +119,8 @@ GOVBR_SCOPE = getenv_or_action(
     "GOVBR_SCOPE", default="openid profile email cpf", action="ignore"
 )
 # TTL for auth state in Redis (seconds) - default 5 minutes
-GOVBR_AUTH_STATE_TTL = int(
-    getenv_or_action("GOVBR_AUTH_STATE_TTL", default="300", action="ignore")
+GOVBR_AUTH_STATE_TTL = getenv_int_or_action(
+    "GOVBR_AUTH_STATE_TTL", default="300", action="ignore"
 )
 
 # Autenticação JWT via Keycloak ("Identidade Carioca") para o servidor MCP
@@ -105,24 +142,35 @@ KEYCLOAK_TRUSTED_CLIENTS = list(
         if client_id.strip()
     )
 )
-LINK_BLACKLIST = getenv_or_action("LINK_BLACKLIST", default="").split(",")
+# Domínios já normalizados (strip + lower) e sem a entrada vazia que um
+# LINK_BLACKLIST ausente geraria.
+LINK_BLACKLIST = frozenset(
+    domain.strip().lower()
+    for domain in getenv_or_action("LINK_BLACKLIST", default="").split(",")
+    if domain.strip()
+)
 
 # Configuração para temas válidos da ferramenta de equipamentos
-EQUIPMENTS_VALID_THEMES = getenv_or_action(
+# Tupla parseada uma única vez: mantém a ordem da configuração para as
+# mensagens e faz `tema in EQUIPMENTS_VALID_THEMES` comparar temas inteiros
+# (e não substrings da string bruta). Aceita lista JSON ou valores separados
+# por vírgula.
+EQUIPMENTS_VALID_THEMES = parse_theme_list(
     "EQUIPMENTS_VALID_THEMES",
-    default="cultura,saude,educacao,geral,assistencia_social,incidentes_hidricos",
+    getenv_or_action(
+        "EQUIPMENTS_VALID_THEMES",
+        default="cultura,saude,educacao,geral,assistencia_social,incidentes_hidricos",
+    ),
 )
 
 # Configuração para excluir ferramentas do servidor MCP
 # Lista de nomes de ferramentas separados por vírgula (ex: "calculator_add,google_search")
-EXCLUDED_TOOLS = list(
-    set(
-        tool.strip()
-        for tool in getenv_or_action(
-            "EXCLUDED_TOOLS", default="user_feedback", action="ignore"
-        ).split(",")
-        if tool.strip()
-    )
+EXCLUDED_TOOLS = frozenset(
+    tool.strip()
+    for tool in getenv_or_action(
+        "EXCLUDED_TOOLS", default="user_feedback", action="ignore"
+    ).split(",")
+    if tool.strip()
 )
 
 # PGM API Configuration
@@ -143,7 +191,7 @@ DIVIDA_ATIVA_API_URL = getenv_or_action("DIVIDA_ATIVA_API_URL")
 DIVIDA_ATIVA_ACCESS_KEY = getenv_or_action("DIVIDA_ATIVA_ACCESS_KEY")
 
 REDIS_URL = getenv_or_action("REDIS_URL")
-REDIS_TTL_SECONDS = int(getenv_or_action("REDIS_TTL_SECONDS"))
+REDIS_TTL_SECONDS = getenv_int_or_action("REDIS_TTL_SECONDS")
 
 PROXY_URL = getenv_or_action("PROXY_URL")
 
@@ -3,7 +3,8 @@ Configurações centralizadas para o servidor FastMCP.
 """
 
 import os
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Mapping, Any
 
 
 class Settings:
@@ -24,18 +25,24 @@ class Settings:
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
     @classmethod
-    def get_server_info(cls) -> Dict[str, Any]:
-        """Retorna informações do servidor"""
-        return {
-            "name": cls.SERVER_NAME,
-            "version": cls.VERSION,
-            "debug": cls.DEBUG,
-            "timezone": cls.TIMEZONE,
-        }
+    def get_server_info(cls) -> Mapping[str, Any]:
+        """Retorna informações do servidor (mapeamento somente leitura)"""
+        return _SERVER_INFO
+
+
+# Montado uma única vez: os valores são constantes de classe
+_SERVER_INFO = MappingProxyType(
+    {
+        "name": Settings.SERVER_NAME,
+        "version": Settings.VERSION,
+        "debug": Settings.DEBUG,
+        "timezone": Settings.TIMEZONE,
+    }
+)
 
 
 # Constantes para os recursos
-DISTRICTS_DATA = [
+DISTRICTS_DATA = (
     "Copacabana",
     "Ipanema",
     "Botafogo",
@@ -60,7 +67,7 @@ DISTRICTS_DATA = [
     "Freguesia",
     "Taquara",
     "Tanque",
-]
+)
 
 # Configuração de exemplo para features extras
 FEATURES_CONFIG = {
@@ -2,29 +2,48 @@
 Ponto de entrada principal para o servidor FastMCP do Rio de Janeiro.
 """
 
+# O pacote `src` é instalado no ambiente pelo `uv sync` (ver `[build-system]`
+# no pyproject), então não manipulamos `sys.path` aqui.
+import asyncio
 import sys
-from pathlib import Path
-
-# Adiciona o diretório raiz do projeto ao Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.app import mcp
 from src.config import env
 from src.observability.tracing import is_tracing_enabled
 
 if __name__ == "__main__":
+    # uvloop substitui o event loop padrão do asyncio (usado pelo `anyio.run`
+    # do FastMCP) por um loop baseado em libuv. Não existe no Windows, então
+    # seguimos com o loop padrão quando não estiver instalado.
+    # `uvloop.install()` está deprecado no Python 3.12+, e o `mcp.run()` cria
+    # o próprio loop, então registramos a policy diretamente. O sistema de
+    # policies do asyncio é deprecado a partir do 3.14.
+    if sys.version_info < (3, 14):
+        try:
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
     if env.IS_LOCAL:
         mcp.run()
     else:
+        from starlette.middleware import Middleware as StarletteMiddleware
+        from starlette.middleware.gzip import GZipMiddleware
+
+        # Comprime respostas JSON a partir de 1KB (ex.: `equipments_instructions`).
+        # O GZipMiddleware não comprime `text/event-stream`, então o streaming
+        # SSE do MCP segue intacto.
+        http_middleware = [StarletteMiddleware(GZipMiddleware, minimum_size=1024)]
+
         # `create_app()` (importado acima via `src.app`) já chamou
         # `setup_tracing()`; aqui apenas verificamos se ficou habilitado
         # para decidir se instrumenta a camada ASGI/HTTP.
-        http_middleware = None
         if is_tracing_enabled():
-            from starlette.middleware import Middleware as StarletteMiddleware
             from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
 
-            http_middleware = [StarletteMiddleware(OpenTelemetryMiddleware)]
+            http_middleware.insert(0, StarletteMiddleware(OpenTelemetryMiddleware))
 
         mcp.run(
             transport="streamable-http",
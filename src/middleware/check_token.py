@@ -5,12 +5,23 @@ from src.config import env
 
 
 class CheckTokenMiddleware(Middleware):
+    def __init__(self) -> None:
+        super().__init__()
+        # Tokens lidos uma única vez na construção, não a cada requisição
+        self.bearer_tokens = env.BEARER_TOKENS
+
     async def on_request(self, context: MiddlewareContext, call_next):
         # Obtém o header Authorization
         auth_header = context.fastmcp_context.get_http_request().headers.get(
             "Authorization"
         )
 
+        # Caminho feliz: o header inteiro ("Bearer <token>") é comparado com
+        # uma única consulta ao frozenset, sem fatiar nem checar o prefixo.
+        if auth_header in self.bearer_tokens:
+            return await call_next(context)
+
+        # Só nas rejeições distinguimos o motivo para a mensagem de erro
         if not auth_header:
             raise HTTPException(
                 status_code=401, detail="Token de autorização não fornecido"
@@ -20,19 +31,4 @@ class CheckTokenMiddleware(Middleware):
         if not auth_header.startswith("Bearer "):
             raise HTTPException(status_code=401, detail="Formato de token inválido")
 
-        # Extrai o token
-        token = auth_header[7:]  # Remove "Bearer "
-
-        # Verifica se o token é válido
-        valid_tokens = env.VALID_TOKENS
-        if isinstance(valid_tokens, str):
-            # Se VALID_TOKENS é uma string, pode ser um único token ou vários separados por vírgula
-            valid_tokens_list = [t.strip() for t in valid_tokens.split(",")]
-        else:
-            # Se já é uma lista
-            valid_tokens_list = valid_tokens
-
-        if token not in valid_tokens_list:
-            raise HTTPException(status_code=401, detail="Token inválido")
-
-        return await call_next(context)
+        raise HTTPException(status_code=401, detail="Token inválido")
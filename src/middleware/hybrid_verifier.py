@@ -10,6 +10,8 @@ os consumidores existentes.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from fastmcp.server.auth import AccessToken, TokenVerifier
 
 from src.middleware.keycloak_verifier import AzpConstrainedJWTVerifier
@@ -21,13 +23,13 @@ class HybridTokenVerifier(TokenVerifier):
     def __init__(
         self,
         *,
-        static_tokens: list[str],
+        static_tokens: Iterable[str],
         jwks_uri: str | None = None,
         issuer: str | None = None,
         allowed_azp: list[str] | None = None,
     ) -> None:
         super().__init__()
-        self._static_tokens: set[str] = set(static_tokens)
+        self._static_tokens: frozenset[str] = frozenset(static_tokens)
         self._jwt_verifier: AzpConstrainedJWTVerifier | None = None
         if jwks_uri and issuer:
             self._jwt_verifier = AzpConstrainedJWTVerifier(
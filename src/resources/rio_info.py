@@ -2,35 +2,34 @@
 Recursos de informações sobre o Rio de Janeiro para o servidor FastMCP.
 """
 
-from typing import List, Dict, Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
 from src.config.settings import DISTRICTS_DATA, Settings
 
 
-def get_districts_list() -> List[str]:
+def get_districts_list() -> tuple[str, ...]:
     """
     Retorna a lista de bairros do Rio de Janeiro.
 
     Returns:
-        Lista com nomes dos principais bairros do Rio de Janeiro
+        Tupla (imutável, sem cópia por chamada) com os nomes dos principais
+        bairros do Rio de Janeiro
     """
-    return DISTRICTS_DATA.copy()
+    return DISTRICTS_DATA
 
 
-def get_rio_basic_info() -> Dict[str, Any]:
-    """
-    Retorna informações básicas sobre o Rio de Janeiro.
-
-    Returns:
-        Dicionário com informações básicas da cidade
-    """
-    return {
+# Informações estáticas montadas uma única vez no import, com tuplas no lugar
+# das listas e exposição somente leitura.
+_RIO_BASIC_INFO = MappingProxyType(
+    {
         "nome": "Rio de Janeiro",
         "estado": "Rio de Janeiro",
         "regiao": "Sudeste",
         "populacao_aproximada": 6_747_815,  # Região metropolitana
         "area_km2": 1_200.27,
         "temperatura_media": "23°C",
-        "pontos_turisticos": [
+        "pontos_turisticos": (
             "Cristo Redentor",
             "Pão de Açúcar",
             "Copacabana",
@@ -38,19 +37,30 @@ def get_rio_basic_info() -> Dict[str, Any]:
             "Maracanã",
             "Lapa",
             "Santa Teresa",
-        ],
-        "principais_praias": [
+        ),
+        "principais_praias": (
             "Copacabana",
             "Ipanema",
             "Leblon",
             "Barra da Tijuca",
             "Recreio dos Bandeirantes",
-        ],
+        ),
         "codigo_area": "21",
         "fuso_horario": Settings.TIMEZONE,
         "fundacao": "1565",
-        "alcunhas": ["Cidade Maravilhosa", "Capital do Samba", "Cidade do Rock"],
+        "alcunhas": ("Cidade Maravilhosa", "Capital do Samba", "Cidade do Rock"),
     }
+)
+
+
+def get_rio_basic_info() -> Mapping[str, Any]:
+    """
+    Retorna informações básicas sobre o Rio de Janeiro.
+
+    Returns:
+        Mapeamento somente leitura com informações básicas da cidade
+    """
+    return _RIO_BASIC_INFO
 
 
 def get_greeting_message() -> str:
@@ -39,11 +39,21 @@ TEST_ENV_DEFAULTS = {
 }
 
 
-for key, value in TEST_ENV_DEFAULTS.items():
-    os.environ.setdefault(key, value)
+# Um único `update` com as chaves ausentes, em vez de um `setdefault` por
+# variável.
+os.environ.update(
+    {
+        key: TEST_ENV_DEFAULTS[key]
+        for key in TEST_ENV_DEFAULTS.keys() - os.environ.keys()
+    }
+)
 
 
 @pytest.fixture(autouse=True)
 def test_env_defaults(monkeypatch):
+    # Só reaplica (e depois restaura) as variáveis que divergem do padrão; as
+    # demais já estão com o valor esperado.
+    environ = os.environ
     for key, value in TEST_ENV_DEFAULTS.items():
-        monkeypatch.setenv(key, value)
+        if environ.get(key) != value:
+            monkeypatch.setenv(key, value)
@@ -1,15 +1,23 @@
+import asyncio
 import runpy
 import sys
 import types
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
+
+from starlette.middleware.gzip import GZipMiddleware
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[4]
 MAIN_PATH = PROJECT_ROOT / "src" / "main.py"
 
 
-def run_main_with_env(monkeypatch, is_local: bool):
+_DEFAULT = object()
+
+
+def run_main_with_env(
+    monkeypatch, is_local: bool, uvloop_module=_DEFAULT, set_event_loop_policy=None
+):
     app_module = types.ModuleType("src.app")
     app_module.mcp = Mock()
 
@@ -32,6 +40,14 @@ def run_main_with_env(monkeypatch, is_local: bool):
     monkeypatch.setitem(sys.modules, "src.config.env", env_module)
     monkeypatch.setitem(sys.modules, "src.observability", observability_pkg)
     monkeypatch.setitem(sys.modules, "src.observability.tracing", tracing_module)
+    # Evita que a policy do uvloop troque a global do processo de testes;
+    # `None` em `sys.modules` faz o `import uvloop` levantar ImportError.
+    if uvloop_module is _DEFAULT:
+        uvloop_module = Mock()
+    monkeypatch.setitem(sys.modules, "uvloop", uvloop_module)
+    monkeypatch.setattr(
+        asyncio, "set_event_loop_policy", set_event_loop_policy or Mock()
+    )
 
     runpy.run_path(str(MAIN_PATH), run_name="__main__")
 
@@ -52,6 +68,36 @@ def test_main_runs_streamable_http_when_not_local(monkeypatch):
         host="0.0.0.0",
         port=80,
         path="/mcp",
-        middleware=None,
+        middleware=ANY,
         stateless_http=True,
     )
+    (gzip,) = mcp.run.call_args.kwargs["middleware"]
+    assert gzip.cls is GZipMiddleware
+    assert gzip.kwargs == {"minimum_size": 1024}
+
+
+def test_main_installs_uvloop_before_running(monkeypatch):
+    uvloop_module = Mock()
+    set_policy = Mock()
+
+    mcp = run_main_with_env(
+        monkeypatch,
+        is_local=False,
+        uvloop_module=uvloop_module,
+        set_event_loop_policy=set_policy,
+    )
+
+    uvloop_module.install.assert_not_called()
+    set_policy.assert_called_once_with(uvloop_module.EventLoopPolicy.return_value)
+    mcp.run.assert_called_once()
+
+
+def test_main_falls_back_to_default_loop_without_uvloop(monkeypatch):
+    set_policy = Mock()
+
+    mcp = run_main_with_env(
+        monkeypatch, is_local=True, uvloop_module=None, set_event_loop_policy=set_policy
+    )
+
+    set_policy.assert_not_called()
+    mcp.run.assert_called_once_with()
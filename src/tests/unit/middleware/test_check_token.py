@@ -19,7 +19,12 @@ def load_check_token_module(monkeypatch, valid_tokens):
     config_pkg = types.ModuleType("src.config")
     config_pkg.__path__ = [str(PROJECT_ROOT / "src" / "config")]
     env_module = types.ModuleType("src.config.env")
-    env_module.VALID_TOKENS = valid_tokens
+    if isinstance(valid_tokens, str):
+        valid_tokens = valid_tokens.split(",")
+    env_module.VALID_TOKENS = frozenset(token.strip() for token in valid_tokens)
+    env_module.BEARER_TOKENS = frozenset(
+        f"Bearer {token}" for token in env_module.VALID_TOKENS
+    )
 
     monkeypatch.setitem(sys.modules, "src", src_pkg)
     monkeypatch.setitem(sys.modules, "src.config", config_pkg)
@@ -40,43 +45,25 @@ def make_context(headers):
     return SimpleNamespace(fastmcp_context=fastmcp_context)
 
 
+@pytest.mark.parametrize(
+    ("headers", "detail"),
+    [
+        ({}, "Token de autorização não fornecido"),
+        ({"Authorization": "Token abc123"}, "Formato de token inválido"),
+        ({"Authorization": "Bearer nope"}, "Token inválido"),
+    ],
+)
 @pytest.mark.asyncio
-async def test_check_token_rejects_missing_authorization(monkeypatch):
-    module = load_check_token_module(monkeypatch, "abc123")
-    middleware = module.CheckTokenMiddleware()
-
-    with pytest.raises(HTTPException, match="não fornecido") as exc_info:
-        await middleware.on_request(make_context({}), AsyncMock())
-
-    assert exc_info.value.status_code == 401
-
-
-@pytest.mark.asyncio
-async def test_check_token_rejects_invalid_bearer_format(monkeypatch):
-    module = load_check_token_module(monkeypatch, "abc123")
-    middleware = module.CheckTokenMiddleware()
-
-    with pytest.raises(HTTPException, match="Formato de token inválido") as exc_info:
-        await middleware.on_request(
-            make_context({"Authorization": "Token abc123"}),
-            AsyncMock(),
-        )
-
-    assert exc_info.value.status_code == 401
-
-
-@pytest.mark.asyncio
-async def test_check_token_rejects_unknown_token(monkeypatch):
+async def test_check_token_rejects_unauthorized_requests(monkeypatch, headers, detail):
     module = load_check_token_module(monkeypatch, "abc123, def456")
     middleware = module.CheckTokenMiddleware()
+    call_next = AsyncMock()
 
-    with pytest.raises(HTTPException, match="Token inválido") as exc_info:
-        await middleware.on_request(
-            make_context({"Authorization": "Bearer nope"}),
-            AsyncMock(),
-        )
+    with pytest.raises(HTTPException, match=detail) as exc_info:
+        await middleware.on_request(make_context(headers), call_next)
 
     assert exc_info.value.status_code == 401
+    call_next.assert_not_awaited()
 
 
 @pytest.mark.asyncio
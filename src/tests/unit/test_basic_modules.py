@@ -78,13 +78,17 @@ def test_settings_get_server_info_returns_expected_shape():
     assert result["version"] == settings.Settings.VERSION
     assert result["timezone"] == settings.Settings.TIMEZONE
     assert isinstance(result["debug"], bool)
+    assert settings.Settings.get_server_info() is result
+    with pytest.raises(TypeError):
+        result["name"] = "outro"
 
 
-def test_rio_info_returns_copy_of_districts():
+def test_rio_info_returns_immutable_districts():
     districts = rio_info.get_districts_list()
-    districts.append("Bairro Inventado")
 
-    assert "Bairro Inventado" not in rio_info.get_districts_list()
+    assert isinstance(districts, tuple)
+    assert districts is rio_info.get_districts_list()
+    assert "Copacabana" in districts
 
 
 def test_rio_basic_info_and_greeting_message():
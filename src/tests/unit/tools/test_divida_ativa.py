@@ -24,9 +24,14 @@ def divida_module(monkeypatch):
     env_module = types.SimpleNamespace(
         CHATBOT_PGM_API_URL="https://pgm.example.local",
         CHATBOT_PGM_ACCESS_KEY="secret-key",
+        REDIS_URL=None,
+        REDIS_TTL_SECONDS=60,
     )
     logger = types.SimpleNamespace(
-        info=lambda *_args, **_kwargs: None, error=lambda *_args, **_kwargs: None
+        info=lambda *_args, **_kwargs: None,
+        error=lambda *_args, **_kwargs: None,
+        warning=lambda *_args, **_kwargs: None,
+        debug=lambda *_args, **_kwargs: None,
     )
     interceptor_module = types.SimpleNamespace(
         interceptor=lambda *args, **kwargs: lambda func: func
@@ -260,3 +265,53 @@ async def test_emitir_guia_wrappers_and_consultar_debitos(divida_module, monkeyp
         }
     )
     assert result["api_resposta_sucesso"] is False
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.setex_calls = []
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.setex_calls.append((key, ttl))
+        self.store[key] = value
+
+
+@pytest.mark.asyncio
+async def test_consultar_dividas_contribuinte_uses_redis_cache(
+    divida_module, monkeypatch
+):
+    fake_redis = FakeRedis()
+    monkeypatch.setattr(divida_module, "_cache_client", fake_redis)
+    calls = []
+
+    async def fake_pgm_api(endpoint, consumidor, data):
+        calls.append(data)
+        if data["cpfCnpj"] == "000":
+            return {"erro": True, "motivos": "Não encontrado"}
+        return {"naturezasDivida": ["IPTU"]}
+
+    monkeypatch.setattr(divida_module, "pgm_api", fake_pgm_api)
+    params = {"origem_solicitação": 0, "cpfCnpj": "12345678900"}
+
+    first = await divida_module.consultar_dividas_contribuinte(params)
+    second = await divida_module.consultar_dividas_contribuinte(dict(params))
+
+    assert first == second == {"naturezasDivida": ["IPTU"]}
+    assert len(calls) == 1
+    assert fake_redis.setex_calls == [
+        (
+            divida_module._consulta_cache_key(params),
+            divida_module.CONSULTA_CACHE_TTL_SECONDS,
+        )
+    ]
+
+    # Respostas de erro não são cacheadas
+    erro = {"origem_solicitação": 0, "cpfCnpj": "000"}
+    await divida_module.consultar_dividas_contribuinte(erro)
+    await divida_module.consultar_dividas_contribuinte(erro)
+    assert len(calls) == 3
+    assert len(fake_redis.setex_calls) == 1
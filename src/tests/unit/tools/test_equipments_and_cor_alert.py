@@ -44,6 +44,7 @@ async def test_cor_alert_normalization_geocode_and_create(monkeypatch):
 
     saved_alerts = []
     queued_alerts = []
+    geocoded_addresses = []
 
     monkeypatch.setitem(
         sys.modules,
@@ -62,6 +63,7 @@ async def test_cor_alert_normalization_geocode_and_create(monkeypatch):
         ENVIRONMENT="test",
         GOOGLE_MAPS_API_URL="https://maps.googleapis.com/maps/api/geocode/json",
         GOOGLE_MAPS_API_KEY="google-key",
+        REDIS_URL=None,
     )
     monkeypatch.setitem(sys.modules, "src.config.env", env_module)
     monkeypatch.setitem(
@@ -72,7 +74,9 @@ async def test_cor_alert_normalization_geocode_and_create(monkeypatch):
         "src.utils.log",
         types.SimpleNamespace(
             logger=types.SimpleNamespace(
-                info=lambda *_a, **_k: None, warning=lambda *_a, **_k: None
+                info=lambda *_a, **_k: None,
+                warning=lambda *_a, **_k: None,
+                error=lambda *_a, **_k: None,
             )
         ),
     )
@@ -110,6 +114,8 @@ async def test_cor_alert_normalization_geocode_and_create(monkeypatch):
                         ],
                     },
                 )
+            geocoded_addresses.append(params["address"])
+            await asyncio.sleep(0)
             return types.SimpleNamespace(
                 raise_for_status=lambda: None,
                 json=lambda: {
@@ -151,6 +157,44 @@ async def test_cor_alert_normalization_geocode_and_create(monkeypatch):
     coords = await module.geocode_address("Rua A, 10")
     assert coords["bairro_normalizado"] == "jardim america"
 
+    # Endereço equivalente após normalização vem do cache, sem nova chamada
+    geocoded_addresses.clear()
+    coords["lat"] = 0
+    cached = await module.geocode_address("  RUA Á,   10 ")
+    assert cached["bairro_normalizado"] == "jardim america"
+    assert cached["lat"] == -22.9
+    assert geocoded_addresses == []
+
+    # Chamadas simultâneas para o mesmo endereço compartilham uma consulta
+    first, second = await asyncio.gather(
+        module.geocode_address("Rua B, 20"), module.geocode_address("rua b, 20")
+    )
+    assert first == second
+    assert first is not second
+    assert geocoded_addresses == ["Rua B, 20, Rio de Janeiro, RJ"]
+    assert module._geocode_inflight == {}
+
+    # Cache no Redis sobrevive ao cache em memória (ex.: após um redeploy)
+    class FakeRedis:
+        def __init__(self):
+            self.store = {}
+
+        async def get(self, key):
+            return self.store.get(key)
+
+        async def setex(self, key, ttl, value):
+            self.store[key] = value
+
+    fake_redis = FakeRedis()
+    monkeypatch.setattr(module, "_geocode_redis_client", fake_redis)
+    geocoded_addresses.clear()
+    await module.geocode_address("Rua C, 30")
+    assert list(fake_redis.store) == ["geo:rua c, 30"]
+    module._geocode_cache.clear()
+    from_redis = await module.geocode_address("rua c, 30")
+    assert from_redis["lat"] == -22.9
+    assert geocoded_addresses == ["Rua C, 30, Rio de Janeiro, RJ"]
+
     result = await module.create_cor_alert("", "alagamento", "alta", "desc", "Rua A")
     assert result["success"] is False
 
@@ -159,14 +203,31 @@ async def test_cor_alert_normalization_geocode_and_create(monkeypatch):
 
     result = await module.create_cor_alert("u1", "alagamento", "alta", "desc", "Rua A")
     assert result["success"] is True
-    assert saved_alerts
     assert queued_alerts
+    # A gravação no BigQuery fica na fila dos workers
+    await module._cor_alert_bq_queue.join()
+    assert saved_alerts[0]["alert_type"] == "alagamento"
 
     queued_alerts.clear()
     result = await module.create_cor_alert("u1", "alagamento", "baixa", "desc", "Rua A")
     assert result["success"] is True
     assert queued_alerts == []
 
+    await module.drain_cor_alert_bq_queue()
+    assert len(saved_alerts) == 2
+    assert module._cor_alert_bq_workers == set()
+
+    # Um insert travado não segura o shutdown além do timeout
+    async def hanging_save(**_kwargs):
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(module, "save_cor_alert_in_bq_background", hanging_save)
+    await module.enqueue_cor_alert_in_bq(alert_id="a1")
+    await module.enqueue_cor_alert_in_bq(alert_id="a2")
+    await asyncio.wait_for(module.drain_cor_alert_bq_queue(timeout=0.05), 1)
+    assert module._cor_alert_bq_workers == set()
+    assert module._cor_alert_bq_queue is None
+
 
 @pytest.mark.asyncio
 async def test_equipments_tools_instructions_and_whitelist(monkeypatch):
@@ -229,11 +290,14 @@ async def test_equipments_tools_instructions_and_whitelist(monkeypatch):
         sys.modules,
         "src.tools.equipments.utils",
         types.SimpleNamespace(
-            get_coords_from_google_maps_api=lambda address: {
-                "lat": -22.9,
-                "lng": -43.2,
-                "bairro_normalizado": "outro-bairro",
-            }
+            get_coords_from_google_maps_api=lambda address: asyncio.sleep(
+                0,
+                result={
+                    "lat": -22.9,
+                    "lng": -43.2,
+                    "bairro_normalizado": "outro-bairro",
+                },
+            )
         ),
     )
     monkeypatch.setitem(
@@ -245,17 +309,17 @@ async def test_equipments_tools_instructions_and_whitelist(monkeypatch):
         ),
     )
 
-    class FakeSyncClient:
+    class FakeAsyncClient:
         def __init__(self, **kwargs):
             pass
 
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, exc_type, exc, tb):
+        async def __aexit__(self, exc_type, exc, tb):
             return None
 
-        def get_sync(self, url, params=None):
+        async def get(self, url, params=None):
             return types.SimpleNamespace(
                 raise_for_status=lambda: None,
                 json=lambda: {
@@ -267,7 +331,7 @@ async def test_equipments_tools_instructions_and_whitelist(monkeypatch):
     monkeypatch.setitem(
         sys.modules,
         "src.utils.http_client",
-        types.SimpleNamespace(InterceptedHTTPClient=FakeSyncClient),
+        types.SimpleNamespace(InterceptedHTTPClient=FakeAsyncClient),
     )
 
     module = load_module(
@@ -315,11 +379,14 @@ async def test_equipments_tools_instructions_and_whitelist(monkeypatch):
         sys.modules,
         "src.tools.equipments.utils",
         types.SimpleNamespace(
-            get_coords_from_google_maps_api=lambda address: {
-                "lat": -22.9,
-                "lng": -43.2,
-                "bairro_normalizado": "bairro-nao-permitido",
-            }
+            get_coords_from_google_maps_api=lambda address: asyncio.sleep(
+                0,
+                result={
+                    "lat": -22.9,
+                    "lng": -43.2,
+                    "bairro_normalizado": "bairro-nao-permitido",
+                },
+            )
         ),
     )
     module = load_module(
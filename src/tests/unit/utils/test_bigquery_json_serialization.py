@@ -4,7 +4,7 @@ import json
 import pytest
 
 from src.utils import bigquery as bigquery_module
-from src.utils.json_utils import CustomJSONEncoder
+from src.utils.json_utils import CustomJSONEncoder, ORJSONResponse
 
 
 @pytest.fixture(autouse=True)
@@ -115,3 +115,19 @@ def test_custom_json_encoder_handles_date_time_and_datetime_types():
         "t": "14:30:00",
         "dt": "2026-01-01T14:30:00+00:00",
     }
+
+
+def test_orjson_response_renders_same_payload_as_custom_encoder():
+    payload = {
+        "d": datetime.date(2026, 1, 1),
+        "t": datetime.time(14, 30, 0),
+        "dt": datetime.datetime(2026, 1, 1, 14, 30, 0, tzinfo=datetime.UTC),
+        "nome": "Dívida Ativa",
+    }
+
+    response = ORJSONResponse(content=payload, status_code=200)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == json.loads(
+        json.dumps(payload, cls=CustomJSONEncoder)
+    )
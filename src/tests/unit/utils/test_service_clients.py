@@ -359,6 +359,7 @@ def test_bigquery_helpers(monkeypatch):
         ),
         SchemaField=lambda *args, **kwargs: ("schema", args, kwargs),
         LoadJobConfig=lambda **kwargs: types.SimpleNamespace(**kwargs),
+        QueryJobConfig=lambda **kwargs: types.SimpleNamespace(**kwargs),
         TimePartitioning=lambda **kwargs: types.SimpleNamespace(**kwargs),
         TimePartitioningType=types.SimpleNamespace(DAY="DAY"),
         SchemaUpdateOption=types.SimpleNamespace(
@@ -402,6 +403,17 @@ def test_bigquery_helpers(monkeypatch):
     assert rows[0]["dt"].startswith("2026-04-08T10:00:00")
     assert rows[0]["d"] == "2026-04-08"
 
+    job_configs = []
+
+    def query_with_params(query, job_config):
+        job_configs.append(job_config)
+        return FakeQueryJob()
+
+    query_client = types.SimpleNamespace(query=query_with_params)
+    rows = module.get_bigquery_result("select @x", query_parameters=["param-x"])
+    assert rows[0]["x"] == 1
+    assert job_configs[0].query_parameters == ["param-x"]
+
     class MissingClient:
         def query(self, query):
             raise not_found("missing")
@@ -674,3 +686,94 @@ async def test_bigquery_background_helpers(monkeypatch):
         environment="staging",
     )
     assert calls[-1][0] is module.save_cor_alert_to_queue
+
+
+@pytest.mark.asyncio
+async def test_intercepted_http_client_reuses_shared_async_client(monkeypatch):
+    ensure_package("src", PROJECT_ROOT / "src")
+    ensure_package("src.utils", PROJECT_ROOT / "src" / "utils")
+    monkeypatch.setitem(
+        sys.modules,
+        "src.utils.error_interceptor",
+        types.SimpleNamespace(send_api_error=None),
+    )
+
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json={"ok": True})
+
+    class FakeAsyncClient(httpx.AsyncClient):
+        def __init__(self, *args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", FakeAsyncClient)
+    module = load_module("test_http_client_module", "src/utils/http_client.py")
+
+    source = {"source": "mcp", "tool": "test"}
+    async with module.InterceptedHTTPClient(
+        user_id="unknown", source=source, timeout=8.0
+    ) as client:
+        response = await client.get("https://example.local/a")
+        first = client._client
+    async with module.InterceptedHTTPClient(user_id="unknown", source=source) as client:
+        await client.get("https://example.local/b")
+        second = client._client
+
+    assert response.json() == {"ok": True}
+    assert first is second is module.get_shared_async_client()
+    assert not first.is_closed
+    # Sem timeout explícito vale o default do httpx (5s)
+    assert timeouts == [8.0, 5.0]
+
+    # Kwargs que não cabem por requisição usam um cliente dedicado
+    async with module.InterceptedHTTPClient(
+        user_id="unknown", source=source, follow_redirects=True
+    ) as client:
+        await client.get("https://example.local/c")
+        dedicated = client._client
+    assert dedicated is not first
+    assert dedicated.is_closed
+
+    await module.aclose_shared_async_client()
+    assert first.is_closed
+
+
+@pytest.mark.asyncio
+async def test_shared_async_client_does_not_keep_cookies(monkeypatch):
+    ensure_package("src", PROJECT_ROOT / "src")
+    ensure_package("src.utils", PROJECT_ROOT / "src" / "utils")
+    monkeypatch.setitem(
+        sys.modules,
+        "src.utils.error_interceptor",
+        types.SimpleNamespace(send_api_error=None),
+    )
+
+    sent_cookies = []
+
+    def handler(request):
+        sent_cookies.append(request.headers.get("cookie"))
+        return httpx.Response(200, headers={"set-cookie": "session=user-A; Path=/"})
+
+    class FakeAsyncClient(httpx.AsyncClient):
+        def __init__(self, *args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", FakeAsyncClient)
+    module = load_module("test_http_client_cookies_module", "src/utils/http_client.py")
+
+    async with module.InterceptedHTTPClient(
+        user_id="user-a", source={"source": "mcp", "tool": "test"}
+    ) as client:
+        await client.get("https://example.local/login")
+    async with module.InterceptedHTTPClient(
+        user_id="user-b", source={"source": "mcp", "tool": "test"}
+    ) as client:
+        await client.get("https://example.local/me")
+        assert len(client._client.cookies) == 0
+
+    assert sent_cookies == [None, None]
+    await module.aclose_shared_async_client()
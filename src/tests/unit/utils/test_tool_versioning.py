@@ -68,6 +68,20 @@ def test_add_tool_version_wraps_response(tmp_path, monkeypatch):
     assert wrapped["data"] == response
 
 
+def test_add_tool_version_uses_preloaded_version_data(tmp_path, monkeypatch):
+    monkeypatch.setattr(tool_versioning, "UTILS_PATH", tmp_path)
+    monkeypatch.setattr(
+        tool_versioning,
+        "get_tool_version_from_file",
+        Mock(side_effect=AssertionError("não deveria ler o arquivo")),
+    )
+    version_data = {"version": "vabc123"}
+
+    wrapped = tool_versioning.add_tool_version({"ok": True}, version_data)
+
+    assert wrapped == {"_tool_metadata": version_data, "data": {"ok": True}}
+
+
 def test_update_version_writes_file(tmp_path, monkeypatch):
     monkeypatch.setattr(tool_versioning, "UTILS_PATH", tmp_path)
     monkeypatch.setattr(tool_versioning, "get_git_commit_hash", lambda: "abc123")
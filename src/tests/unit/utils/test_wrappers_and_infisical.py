@@ -80,6 +80,16 @@ def test_load_dotenv_returns_empty_when_missing(
     assert infisical_module._load_dotenv() == {}
 
 
+def test_load_dotenv_caches_missing_file(tmp_path, monkeypatch, infisical_module):
+    monkeypatch.chdir(tmp_path)
+
+    assert infisical_module._load_dotenv() == {}
+    (tmp_path / ".env").write_text("FOO=bar", encoding="utf-8")
+
+    # O arquivo ausente não é procurado de novo a cada variável faltante
+    assert infisical_module._load_dotenv() == {}
+
+
 def test_load_dotenv_parses_values_and_uses_cache(
     tmp_path, monkeypatch, infisical_module
 ):
@@ -136,6 +146,23 @@ def test_getenv_or_action_rejects_invalid_action(infisical_module):
         infisical_module.getenv_or_action("ANY", action="oops")
 
 
+def test_getenv_int_or_action_parses_and_reports_invalid(monkeypatch, infisical_module):
+    monkeypatch.setenv("INT_VALUE", "42")
+    monkeypatch.setenv("BAD_INT", "abc")
+    monkeypatch.delenv("MISSING_INT", raising=False)
+
+    assert infisical_module.getenv_int_or_action("INT_VALUE") == 42
+    assert (
+        infisical_module.getenv_int_or_action(
+            "MISSING_INT", default="7", action="ignore"
+        )
+        == 7
+    )
+    assert infisical_module.getenv_int_or_action("MISSING_INT", action="ignore") is None
+    with pytest.raises(ValueError, match="BAD_INT"):
+        infisical_module.getenv_int_or_action("BAD_INT")
+
+
 def test_getenv_list_or_action_and_mask_string(monkeypatch, infisical_module):
     monkeypatch.setattr(
         infisical_module,
@@ -158,6 +185,30 @@ def test_getenv_list_or_action_and_mask_string(monkeypatch, infisical_module):
     assert infisical_module.mask_string("abcdefghi", mask="#") == "a#####i"
 
 
+def test_parse_theme_list_accepts_json_list():
+    from src.config.env import parse_theme_list
+
+    assert parse_theme_list("THEMES", '["geral"]') == ("geral",)
+    assert parse_theme_list("THEMES", ' ["geral", " saude ", ""] ') == (
+        "geral",
+        "saude",
+    )
+    with pytest.raises(ValueError, match="THEMES"):
+        parse_theme_list("THEMES", '["geral",')
+    with pytest.raises(ValueError, match="THEMES"):
+        parse_theme_list("THEMES", "[1, 2]")
+
+
+def test_parse_theme_list_accepts_comma_separated_values():
+    from src.config.env import parse_theme_list
+
+    assert parse_theme_list("THEMES", "geral, saude,,educacao") == (
+        "geral",
+        "saude",
+        "educacao",
+    )
+
+
 def build_wrapper_module(
     monkeypatch, module_name: str, relative_path: str, env_values: dict
 ):
@@ -678,6 +678,34 @@ async def test_pix_page_service_uploads_and_shortens_url(monkeypatch):
     }
 
 
+def test_pix_page_service_decodes_service_account_once(monkeypatch):
+    module = load_module(
+        "test_iptu_pix_page_service_credentials_module",
+        "src/tools/multi_step_service/workflows/iptu_pagamento/pix_page_service.py",
+    )
+    env_module = types.SimpleNamespace(WORKFLOWS_GCP_SERVICE_ACCOUNT="e30=")
+    monkeypatch.setattr(module, "env", env_module)
+    received = []
+    monkeypatch.setattr(
+        module.service_account.Credentials,
+        "from_service_account_info",
+        lambda info: received.append(info) or "credentials",
+    )
+    # O cache é compartilhado com as credenciais do BigQuery (src.utils)
+    module.decode_service_account_info.cache_clear()
+
+    service = module.IPTUPixPageService()
+    assert service.get_credentials_from_env() == "credentials"
+    assert service.get_credentials_from_env() == "credentials"
+
+    assert received == [{}, {}]
+    assert received[0] is received[1]
+    assert module.decode_service_account_info.cache_info().misses == 1
+    # O valor cacheado é compartilhado, então não pode ser alterado
+    with pytest.raises(TypeError):
+        received[0]["client_email"] = "outro@exemplo"
+
+
 @pytest.mark.asyncio
 async def test_pix_page_service_shortener_fallbacks(monkeypatch):
     module = load_module(
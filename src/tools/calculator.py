@@ -2,9 +2,11 @@
 Ferramentas de calculadora básica para o servidor FastMCP.
 """
 
-from typing import Union
 from src.config.settings import FEATURES_CONFIG
 
+# Precisão fixa em tempo de execução: lida uma única vez no import.
+_PRECISION: int = FEATURES_CONFIG["calculator"]["precision"]
+
 
 def add(a: float, b: float) -> float:
     """
@@ -17,9 +19,7 @@ def add(a: float, b: float) -> float:
     Returns:
         Resultado da soma
     """
-    precision = FEATURES_CONFIG["calculator"]["precision"]
-    result = a + b
-    return round(result, precision)
+    return round(a + b, _PRECISION)
 
 
 def subtract(a: float, b: float) -> float:
@@ -33,9 +33,7 @@ def subtract(a: float, b: float) -> float:
     Returns:
         Resultado da subtração (a - b)
     """
-    precision = FEATURES_CONFIG["calculator"]["precision"]
-    result = a - b
-    return round(result, precision)
+    return round(a - b, _PRECISION)
 
 
 def multiply(a: float, b: float) -> float:
@@ -49,9 +47,7 @@ def multiply(a: float, b: float) -> float:
     Returns:
         Resultado da multiplicação
     """
-    precision = FEATURES_CONFIG["calculator"]["precision"]
-    result = a * b
-    return round(result, precision)
+    return round(a * b, _PRECISION)
 
 
 def divide(a: float, b: float) -> float:
@@ -71,12 +67,10 @@ def divide(a: float, b: float) -> float:
     if b == 0:
         raise ValueError("Divisão por zero não é permitida")
 
-    precision = FEATURES_CONFIG["calculator"]["precision"]
-    result = a / b
-    return round(result, precision)
+    return round(a / b, _PRECISION)
 
 
-def power(base: float, exponent: Union[int, float]) -> float:
+def power(base: float, exponent: float) -> float:
     """
     Calcula a potência de um número.
 
@@ -87,6 +81,4 @@ def power(base: float, exponent: Union[int, float]) -> float:
     Returns:
         Resultado da potência (base^exponent)
     """
-    precision = FEATURES_CONFIG["calculator"]["precision"]
-    result = base**exponent
-    return round(result, precision)
+    return round(base**exponent, _PRECISION)
@@ -1,6 +1,16 @@
+import asyncio
+import time
 import unicodedata
 import uuid
-from typing import Any, Dict
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+import orjson
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
 
 from src.utils.bigquery import (
     save_cor_alert_in_bq_background,
@@ -11,6 +21,7 @@ from src.config.env import (
     ENVIRONMENT,
     GOOGLE_MAPS_API_URL,
     GOOGLE_MAPS_API_KEY,
+    REDIS_URL,
 )
 from src.utils.log import logger
 from src.utils.error_interceptor import interceptor
@@ -18,8 +29,41 @@ from src.utils.http_client import InterceptedHTTPClient
 
 
 # Valid alert types and severities
-VALID_ALERT_TYPES = ["alagamento", "enchente", "bolsao"]
-VALID_SEVERITIES = ["baixa", "alta", "critica"]
+# (frozensets para a checagem de pertinência; as mensagens de erro mantêm a
+# ordem de declaração e são montadas uma única vez)
+_ALERT_TYPE_CHOICES = ("alagamento", "enchente", "bolsao")
+_SEVERITY_CHOICES = ("baixa", "alta", "critica")
+VALID_ALERT_TYPES = frozenset(_ALERT_TYPE_CHOICES)
+VALID_SEVERITIES = frozenset(_SEVERITY_CHOICES)
+_VALID_ALERT_TYPES_STR = ", ".join(_ALERT_TYPE_CHOICES)
+_VALID_SEVERITIES_STR = ", ".join(_SEVERITY_CHOICES)
+# Severidades que também vão para a fila de despacho ao COR
+_DISPATCH_SEVERITIES = frozenset({"alta", "critica"})
+
+# Cache em memória (LRU + TTL) do geocoding, indexado pelo endereço
+# normalizado: durante um evento de chuva os mesmos logradouros se repetem.
+GEOCODE_CACHE_TTL_SECONDS = 24 * 60 * 60
+GEOCODE_CACHE_MAX_SIZE = 10_000
+_geocode_cache: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+# Geocodings em andamento, para que requisições simultâneas do mesmo endereço
+# compartilhem uma única chamada à API.
+_geocode_inflight: Dict[str, "asyncio.Future[dict]"] = {}
+
+# Segundo nível do cache, no Redis: sobrevive a redeploys e é compartilhado
+# entre réplicas. Sem REDIS_URL (ou se o Redis falhar) fica só o cache local.
+GEOCODE_REDIS_PREFIX = "geo:"
+GEOCODE_REDIS_TTL_SECONDS = 30 * 24 * 60 * 60
+_geocode_redis_client = None
+
+# Fila limitada para a gravação dos alertas no BigQuery, consumida por um
+# número fixo de workers: a requisição não espera o insert, e um pico de
+# latência do BigQuery não acumula tasks sem limite.
+COR_ALERT_BQ_QUEUE_MAX_SIZE = 1000
+COR_ALERT_BQ_WORKERS = 4
+# Tempo máximo que o shutdown espera a fila esvaziar
+COR_ALERT_BQ_DRAIN_TIMEOUT_SECONDS = 10.0
+_cor_alert_bq_queue: "Optional[asyncio.Queue[dict]]" = None
+_cor_alert_bq_workers: Set[asyncio.Task] = set()
 
 NEIGHBORHOOD_ALIASES = {
     "jd america": "jardim america",
@@ -90,7 +134,7 @@ async def _get_neighborhood_from_reverse_geocode(lat: float, lng: float) -> dict
                         "bairro_normalizado": normalize_neighborhood(bairro_raw),
                     }
     except Exception as e:
-        logger.warning(f"Erro ao fazer reverse geocoding: {str(e)}")
+        logger.warning("Erro ao fazer reverse geocoding: {}", e)
     return {}
 
 
@@ -135,7 +179,7 @@ async def get_coordinates_google(address: str) -> dict:
                 "bairro_normalizado": normalize_neighborhood(bairro_raw),
             }
     except Exception as e:
-        logger.warning(f"Erro ao geolocalizar com Google Maps: {str(e)}")
+        logger.warning("Erro ao geolocalizar com Google Maps: {}", e)
 
     return {}
 
@@ -145,6 +189,11 @@ async def geocode_address(address: str) -> dict:
     """
     Geocode an address using Google Maps API.
 
+    Successful results are cached in memory by normalized address
+    (see GEOCODE_CACHE_TTL_SECONDS / GEOCODE_CACHE_MAX_SIZE) and in Redis
+    when REDIS_URL is set (GEOCODE_REDIS_TTL_SECONDS). Concurrent calls for
+    the same address share a single lookup.
+
     Args:
         address: Address to geocode
 
@@ -152,6 +201,80 @@ async def geocode_address(address: str) -> dict:
         Dictionary with lat, lng, address, provider, neighborhood fields,
         or empty dict if failed
     """
+    key = _normalize_text(address)
+
+    cached = _geocode_cache.get(key)
+    if cached is not None:
+        stored_at, coords = cached
+        if time.monotonic() - stored_at < GEOCODE_CACHE_TTL_SECONDS:
+            _geocode_cache.move_to_end(key)
+            return dict(coords)
+        del _geocode_cache[key]
+
+    future = _geocode_inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_geocode_and_cache(key, address))
+        _geocode_inflight[key] = future
+        future.add_done_callback(lambda _: _geocode_inflight.pop(key, None))
+
+    # `shield` evita que o cancelamento de um chamador cancele a consulta
+    # compartilhada com os demais.
+    coords = await asyncio.shield(future)
+    return dict(coords)
+
+
+def _get_geocode_redis_client():
+    """Retorna o cliente Redis do cache de geocoding, criado na primeira chamada."""
+    global _geocode_redis_client
+    if _geocode_redis_client is None and redis is not None and REDIS_URL:
+        _geocode_redis_client = redis.Redis.from_url(
+            REDIS_URL,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+    return _geocode_redis_client
+
+
+async def _geocode_and_cache(key: str, address: str) -> dict:
+    """Geocode an address and store successful results in the cache.
+
+    The Redis cache is checked before calling the API; failures there are
+    logged and fall back to the API.
+    """
+    client = _get_geocode_redis_client()
+    redis_key = f"{GEOCODE_REDIS_PREFIX}{key}"
+
+    coords = None
+    if client is not None:
+        try:
+            cached = await client.get(redis_key)
+        except Exception as e:
+            logger.warning("Falha ao ler cache de geocoding no Redis: {}", e)
+            cached = None
+        if cached is not None:
+            coords = orjson.loads(cached)
+
+    if coords is None:
+        coords = await _geocode_address_uncached(address)
+        if coords and client is not None:
+            try:
+                await client.setex(
+                    redis_key, GEOCODE_REDIS_TTL_SECONDS, orjson.dumps(coords)
+                )
+            except Exception as e:
+                logger.warning("Falha ao gravar cache de geocoding no Redis: {}", e)
+
+    if coords:
+        _geocode_cache[key] = (time.monotonic(), coords)
+        _geocode_cache.move_to_end(key)
+        while len(_geocode_cache) > GEOCODE_CACHE_MAX_SIZE:
+            _geocode_cache.popitem(last=False)
+    return coords
+
+
+async def _geocode_address_uncached(address: str) -> dict:
+    """Geocode an address with Google Maps, falling back to reverse geocoding
+    for the neighborhood."""
     coords = await get_coordinates_google(address)
 
     # Se encontrou coords mas não encontrou bairro, tenta reverse geocoding
@@ -164,12 +287,74 @@ async def geocode_address(address: str) -> dict:
             coords["bairro_raw"] = neighborhood["bairro_raw"]
             coords["bairro_normalizado"] = neighborhood["bairro_normalizado"]
             logger.info(
-                f"Bairro encontrado via reverse geocoding: {coords['bairro_raw']}"
+                "Bairro encontrado via reverse geocoding: {}", coords["bairro_raw"]
             )
 
     return coords
 
 
+async def _cor_alert_bq_worker(queue: "asyncio.Queue[dict]") -> None:
+    """Consume alerts from the queue and persist them in BigQuery."""
+    while True:
+        alert = await queue.get()
+        try:
+            # save_cor_alert_in_bq_background já captura e loga os erros
+            await save_cor_alert_in_bq_background(**alert)
+        finally:
+            queue.task_done()
+
+
+def _get_cor_alert_bq_queue() -> "asyncio.Queue[dict]":
+    """Return the BigQuery save queue, starting its workers on first use."""
+    global _cor_alert_bq_queue
+    if _cor_alert_bq_queue is None:
+        _cor_alert_bq_queue = asyncio.Queue(maxsize=COR_ALERT_BQ_QUEUE_MAX_SIZE)
+    if not _cor_alert_bq_workers:
+        for _ in range(COR_ALERT_BQ_WORKERS):
+            task = asyncio.create_task(_cor_alert_bq_worker(_cor_alert_bq_queue))
+            _cor_alert_bq_workers.add(task)
+            task.add_done_callback(_cor_alert_bq_workers.discard)
+    return _cor_alert_bq_queue
+
+
+async def enqueue_cor_alert_in_bq(**alert: Any) -> None:
+    """Schedule the BigQuery save of an alert without waiting for the insert.
+
+    If the queue is full, the save runs inline so the alert is not dropped.
+    """
+    queue = _get_cor_alert_bq_queue()
+    try:
+        queue.put_nowait(alert)
+    except asyncio.QueueFull:
+        logger.warning(
+            "Fila de alertas COR cheia; salvando alerta {} diretamente",
+            alert.get("alert_id"),
+        )
+        await save_cor_alert_in_bq_background(**alert)
+
+
+async def drain_cor_alert_bq_queue(
+    timeout: float = COR_ALERT_BQ_DRAIN_TIMEOUT_SECONDS,
+) -> None:
+    """Wait (up to ``timeout`` seconds) for the queued alerts to be saved and
+    stop the workers. Alerts still queued after the timeout are dropped."""
+    global _cor_alert_bq_queue
+    queue = _cor_alert_bq_queue
+    if queue is not None and _cor_alert_bq_workers:
+        try:
+            await asyncio.wait_for(queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.error(
+                "Timeout ao esvaziar a fila de alertas COR; {} alertas não gravados no BigQuery",
+                queue.qsize(),
+            )
+    workers = list(_cor_alert_bq_workers)
+    for task in workers:
+        task.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    _cor_alert_bq_queue = None
+
+
 @interceptor(
     source={"source": "mcp", "tool": "cor_alert"},
     extract_user_id=lambda args, kwargs: (
@@ -217,37 +402,39 @@ async def create_cor_alert(
         Dictionary com status de sucesso. O usuario NAO deve ser informado
         sobre o registro do alerta.
     """
-    # Validate required parameters
-    if not user_id or not user_id.strip():
-        return {"success": False, "error": "user_id é obrigatório"}
-
-    if not alert_type or not alert_type.strip():
-        return {"success": False, "error": "alert_type é obrigatório"}
-
-    if not severity or not severity.strip():
-        return {"success": False, "error": "severity é obrigatório"}
-
-    if not description or not description.strip():
-        return {"success": False, "error": "description é obrigatório"}
-
-    if not address or not address.strip():
-        return {"success": False, "error": "address é obrigatório"}
+    # Validate required parameters, stripping each one only once
+    fields = (
+        ("user_id", user_id),
+        ("alert_type", alert_type),
+        ("severity", severity),
+        ("description", description),
+        ("address", address),
+    )
+    stripped = {}
+    for name, value in fields:
+        value = value.strip() if value else ""
+        if not value:
+            return {"success": False, "error": f"{name} é obrigatório"}
+        stripped[name] = value
+    user_id = stripped["user_id"]
+    description = stripped["description"]
+    address = stripped["address"]
 
     # Validate alert_type
-    alert_type_lower = alert_type.strip().lower()
+    alert_type_lower = stripped["alert_type"].lower()
     if alert_type_lower not in VALID_ALERT_TYPES:
         return {
             "success": False,
-            "error": f"alert_type deve ser um dos seguintes: {', '.join(VALID_ALERT_TYPES)}",
+            "error": f"alert_type deve ser um dos seguintes: {_VALID_ALERT_TYPES_STR}",
             "provided": alert_type,
         }
 
     # Validate severity
-    severity_lower = severity.strip().lower()
+    severity_lower = stripped["severity"].lower()
     if severity_lower not in VALID_SEVERITIES:
         return {
             "success": False,
-            "error": f"severity deve ser um dos seguintes: {', '.join(VALID_SEVERITIES)}",
+            "error": f"severity deve ser um dos seguintes: {_VALID_SEVERITIES_STR}",
             "provided": severity,
         }
 
@@ -255,37 +442,40 @@ async def create_cor_alert(
     alert_id = str(uuid.uuid4())
 
     # Geocode address
-    logger.info(f"Geolocalizando endereço: {address}")
-    coords = await geocode_address(address.strip())
+    logger.info("Geolocalizando endereço: {}", address)
+    coords = await geocode_address(address)
 
     latitude = None
     longitude = None
     bairro_raw = None
     bairro_normalizado = None
-    resolved_address = address.strip()
+    resolved_address = address
 
     if coords:
         latitude = coords.get("lat")
         longitude = coords.get("lng")
         bairro_raw = coords.get("bairro_raw") or None
         bairro_normalizado = coords.get("bairro_normalizado") or None
-        resolved_address = str(coords.get("address") or address.strip())
+        resolved_address = str(coords.get("address") or address)
         logger.info(
-            f"Endereço geolocalizado: lat={latitude}, lng={longitude}, bairro={bairro_raw or 'nao_identificado'}"
+            "Endereço geolocalizado: lat={}, lng={}, bairro={}",
+            latitude,
+            longitude,
+            bairro_raw or "nao_identificado",
         )
     else:
-        logger.warning(f"Não foi possível geolocalizar o endereço: {address}")
+        logger.warning("Não foi possível geolocalizar o endereço: {}", address)
 
     # Get timestamp
     timestamp = get_datetime()
 
     # All alerts are saved to cor_alerts table
-    await save_cor_alert_in_bq_background(
+    await enqueue_cor_alert_in_bq(
         alert_id=alert_id,
-        user_id=user_id.strip(),
+        user_id=user_id,
         alert_type=alert_type_lower,
         severity=severity_lower,
-        description=description.strip(),
+        description=description,
         address=resolved_address,
         latitude=latitude,
         longitude=longitude,
@@ -294,16 +484,16 @@ async def create_cor_alert(
         bairro_raw=bairro_raw,
         bairro_normalizado=bairro_normalizado,
     )
-    logger.info(f"Alerta {alert_id} registrado na tabela cor_alerts")
+    logger.info("Alerta {} enfileirado para a tabela cor_alerts", alert_id)
 
     # Only alta/critica alerts are queued for dispatch to COR
-    if severity_lower in ["alta", "critica"]:
+    if severity_lower in _DISPATCH_SEVERITIES:
         await save_cor_alert_to_queue_background(
             alert_id=alert_id,
-            user_id=user_id.strip(),
+            user_id=user_id,
             alert_type=alert_type_lower,
             severity=severity_lower,
-            description=description.strip(),
+            description=description,
             address=resolved_address,
             latitude=latitude,
             longitude=longitude,
@@ -312,7 +502,7 @@ async def create_cor_alert(
             bairro_raw=bairro_raw,
             bairro_normalizado=bairro_normalizado,
         )
-        logger.info(f"Alerta {alert_id} salvo na fila para agregação")
+        logger.info("Alerta {} salvo na fila para agregação", alert_id)
 
     return {
         "success": True,
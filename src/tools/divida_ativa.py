@@ -1,9 +1,16 @@
 import ast
 import time
 import asyncio
+import hashlib
 from functools import wraps
 from typing import Dict, Any, Optional
 
+import orjson
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
 
 from src.tools.utils import internal_request
 from src.utils.log import logger
@@ -204,6 +211,81 @@ async def pgm_api(
         raise
 
 
+# Cache Redis da consulta de débitos (somente leitura). A emissão de guias não é
+# cacheada: cada chamada gera uma guia nova na PGM.
+# O TTL é curto e próprio deste cache: pagamentos acontecem fora daqui (banco,
+# PIX) e não há como invalidar a entrada, então a consulta pode mostrar um
+# débito já quitado por no máximo CONSULTA_CACHE_TTL_SECONDS.
+CONSULTA_CACHE_PREFIX = "da:consulta:"
+CONSULTA_CACHE_TTL_SECONDS = 5 * 60
+_cache_client = None
+
+
+def _get_cache_client():
+    """Retorna o cliente Redis compartilhado, criado na primeira chamada."""
+    global _cache_client
+    if _cache_client is None and redis is not None and env.REDIS_URL:
+        _cache_client = redis.Redis.from_url(
+            env.REDIS_URL,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+    return _cache_client
+
+
+def _consulta_cache_key(parametros_entrada: Dict[str, Any]) -> str:
+    digest = hashlib.sha1(
+        orjson.dumps(parametros_entrada, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+    return f"{CONSULTA_CACHE_PREFIX}{digest}"
+
+
+async def consultar_dividas_contribuinte(
+    parametros_entrada: Dict[str, Any],
+) -> dict:
+    """
+    Consulta as dívidas do contribuinte na PGM com cache Redis.
+
+    A chave é derivada dos parâmetros já normalizados (somente dígitos), então
+    variações de formatação do mesmo CPF/inscrição reaproveitam a entrada.
+    Apenas respostas sem erro são gravadas, com TTL `CONSULTA_CACHE_TTL_SECONDS`
+    (janela máxima em que um débito já pago ainda aparece como em aberto).
+    Falhas do Redis não interrompem a consulta: seguimos direto para a API.
+
+    Args:
+        parametros_entrada: Payload enviado ao endpoint de dívidas
+
+    Returns:
+        Registros retornados pela PGM (ou pelo cache)
+    """
+    client = _get_cache_client()
+    key = _consulta_cache_key(parametros_entrada)
+
+    if client is not None:
+        try:
+            cached = await client.get(key)
+        except Exception as e:
+            logger.warning("Falha ao ler cache da consulta de débitos: {}", e)
+            cached = None
+        if cached is not None:
+            logger.debug("consulta_debitos cache hit: {}", key)
+            return orjson.loads(cached)
+
+    registros = await pgm_api(
+        endpoint="v2/cdas/dividas-contribuinte",
+        consumidor="consultar-dividas-contribuinte",
+        data=parametros_entrada,
+    )
+
+    if client is not None and "erro" not in registros:
+        try:
+            await client.setex(key, CONSULTA_CACHE_TTL_SECONDS, orjson.dumps(registros))
+        except Exception as e:
+            logger.warning("Falha ao gravar cache da consulta de débitos: {}", e)
+
+    return registros
+
+
 async def da_emitir_guia(
     parameters: Dict[str, Any], tipo: str
 ) -> Optional[Dict[str, Any]]:
@@ -423,11 +505,7 @@ async def consultar_debitos(parameters: Dict[str, Any]) -> Dict[str, Any]:
 
             parametros_entrada["anoAutoInfracao"] = ano_limpo
 
-        registros = await pgm_api(
-            endpoint="v2/cdas/dividas-contribuinte",
-            consumidor="consultar-dividas-contribuinte",
-            data=parametros_entrada,
-        )
+        registros = await consultar_dividas_contribuinte(parametros_entrada)
 
         if "erro" in registros:
             return {
@@ -1,149 +1,195 @@
+import asyncio
 from typing import List, Optional
 
+from google.cloud import bigquery
+
 from src.tools.equipments.utils import get_plus8_coords_from_address
 from src.utils.bigquery import get_bigquery_result
 from src.utils.error_interceptor import interceptor
 from src.utils.log import logger
 
 
+# Texto fixo das queries (valores vão como parâmetros): montado uma vez no
+# import, e o mesmo SQL a cada chamada favorece o cache de resultados do
+# BigQuery.
+_PLUSCODE_EQUIPMENTS_QUERY_TEMPLATE = """
+        with
+        equipamentos as (
+            select
+                t.plus8 as plus8_grid,
+                eq.plus8,
+                eq.plus10,
+                cast(eq.distancia_metros as int64) as distancia_metros,
+                t.secretaria_responsavel,
+                t.categoria,
+                eq.id_equipamento,
+                eq.nome_oficial,
+                eq.nome_popular,
+                eq.endereco.logradouro,
+                eq.endereco.numero,
+                eq.endereco.complemento,
+                coalesce(eq.bairro.bairro, eq.endereco.bairro) as bairro,
+                eq.bairro.regiao_planejamento,
+                eq.bairro.regiao_administrativa,
+                eq.bairro.subprefeitura,
+                eq.contato,
+                eq.ativo,
+                eq.aberto_ao_publico,
+                eq.esfera,
+                eq.horario_funcionamento,
+                eq.updated_at,
+            from `rj-iplanrio.plus_codes.codes` t, unnest(equipamentos) as eq
+            where eq.use = TRUE 
+            and t.plus8 = @plus8
+            __replace_categories__
+            qualify
+                row_number() over (
+                    partition by t.plus8, t.secretaria_responsavel, t.categoria
+                    order by cast(eq.distancia_metros as int64)
+                )
+                = 1
+        ),
+
+        tb_territorio as (
+        SELECT 
+            secretaria_responsavel,
+            categoria,
+            geometry,
+            equipamentos as eq
+        FROM `rj-iplanrio.plus_codes.territorio`
+        ),
+        
+        equipamentos_territorio as (
+            SELECT
+                CAST(NULL as STRING) as plus8_grid,
+                eq.plus8,
+                eq.plus10,
+                CAST(st_distance(ST_GEOGPOINT(eq.longitude,eq.latitude), ST_GEOGPOINT(@longitude, @latitude)) AS INT64) as distancia_metros,
+                t.secretaria_responsavel,
+                t.categoria,
+                eq.id_equipamento,
+                eq.nome_oficial,
+                eq.nome_popular,
+                eq.endereco.logradouro,
+                eq.endereco.numero,
+                eq.endereco.complemento,
+                coalesce(eq.bairro.bairro, eq.endereco.bairro) as bairro,
+                eq.bairro.regiao_planejamento,
+                eq.bairro.regiao_administrativa,
+                eq.bairro.subprefeitura,
+                eq.contato,
+                eq.ativo,
+                eq.aberto_ao_publico,
+                eq.esfera,
+                eq.horario_funcionamento,
+                eq.updated_at,
+            FROM tb_territorio t
+            where eq.use = TRUE 
+            and ST_WITHIN(ST_GEOGPOINT(@longitude, @latitude), geometry)
+            __replace_categories__
+            order by eq.secretaria_responsavel, eq.categoria
+        ),
+        
+       final_tb as (
+            -- Prioridade para equipamentos do territorio
+            SELECT * 
+            FROM equipamentos_territorio
+            UNION ALL
+            -- Adiciona equipamentos da grid apenas se a categoria não existe no territorio
+            SELECT *
+            FROM equipamentos eq
+            WHERE NOT EXISTS (
+                SELECT 1 
+                FROM equipamentos_territorio et
+                WHERE et.secretaria_responsavel = eq.secretaria_responsavel
+                AND et.categoria = eq.categoria
+            )
+        )
+
+        SELECT *
+        FROM final_tb
+        order by secretaria_responsavel, categoria
+    """
+_PLUSCODE_EQUIPMENTS_QUERY = _PLUSCODE_EQUIPMENTS_QUERY_TEMPLATE.replace(
+    "__replace_categories__", ""
+)
+_PLUSCODE_EQUIPMENTS_BY_CATEGORY_QUERY = _PLUSCODE_EQUIPMENTS_QUERY_TEMPLATE.replace(
+    "__replace_categories__", "and t.categoria in unnest(@categories)"
+)
+
+_CATEGORY_EQUIPMENTS_QUERY = """
+        with
+        equipamentos as (
+            SELECT
+                DISTINCT
+                    TRIM(t.secretaria_responsavel) as secretaria_responsavel,
+                    TRIM(t.categoria) as categoria
+            FROM `rj-iplanrio.plus_codes.codes` t, unnest(equipamentos) as eq
+            WHERE t.categoria IS NOT NULL and eq.use = TRUE
+            UNION ALL
+            SELECT 
+            DISTINCT
+                    TRIM(t.secretaria_responsavel) as secretaria_responsavel,
+                    TRIM(t.categoria) as categoria
+            FROM `rj-iplanrio.plus_codes.territorio` t
+            WHERE t.categoria IS NOT NULL and t.equipamentos.use = TRUE
+        )
+
+    select *
+    from equipamentos eq
+    order by eq.secretaria_responsavel, eq.categoria
+    """
+
+
+async def _run_bigquery_query(query: str, query_parameters: List = None) -> List[dict]:
+    # get_bigquery_result é síncrona e bloqueia até o fim da query; roda numa
+    # thread para não travar o event loop. `to_thread` copia os contextvars,
+    # mantendo o span do BigQuery dentro do trace da tool.
+    return await asyncio.to_thread(
+        get_bigquery_result, query, query_parameters=query_parameters
+    )
+
+
 @interceptor(source={"source": "mcp", "tool": "equipments"})
 async def get_pluscode_coords_equipments(
     address, categories: Optional[List[str]] = None
 ) -> dict:
     categories = categories or []
-    plus8, coords = get_plus8_coords_from_address(address=address)
+    plus8, coords = await get_plus8_coords_from_address(address=address)
     if not coords:
         raise Exception("No coords found")
 
-    if plus8:
-        latitude = coords["lat"]
-        longitude = coords["lng"]
-        query = f"""
-            with
-            equipamentos as (
-                select
-                    t.plus8 as plus8_grid,
-                    eq.plus8,
-                    eq.plus10,
-                    cast(eq.distancia_metros as int64) as distancia_metros,
-                    t.secretaria_responsavel,
-                    t.categoria,
-                    eq.id_equipamento,
-                    eq.nome_oficial,
-                    eq.nome_popular,
-                    eq.endereco.logradouro,
-                    eq.endereco.numero,
-                    eq.endereco.complemento,
-                    coalesce(eq.bairro.bairro, eq.endereco.bairro) as bairro,
-                    eq.bairro.regiao_planejamento,
-                    eq.bairro.regiao_administrativa,
-                    eq.bairro.subprefeitura,
-                    eq.contato,
-                    eq.ativo,
-                    eq.aberto_ao_publico,
-                    eq.esfera,
-                    eq.horario_funcionamento,
-                    eq.updated_at,
-                from `rj-iplanrio.plus_codes.codes` t, unnest(equipamentos) as eq
-                where eq.use = TRUE 
-                and t.plus8 = "{plus8}"
-                __replace_categories__
-                qualify
-                    row_number() over (
-                        partition by t.plus8, t.secretaria_responsavel, t.categoria
-                        order by cast(eq.distancia_metros as int64)
-                    )
-                    = 1
-            ),
-
-            tb_territorio as (
-            SELECT 
-                secretaria_responsavel,
-                categoria,
-                geometry,
-                equipamentos as eq
-            FROM `rj-iplanrio.plus_codes.territorio`
-            ),
-            
-            equipamentos_territorio as (
-                SELECT
-                    CAST(NULL as STRING) as plus8_grid,
-                    eq.plus8,
-                    eq.plus10,
-                    CAST(st_distance(ST_GEOGPOINT(eq.longitude,eq.latitude), ST_GEOGPOINT({longitude}, {latitude})) AS INT64) as distancia_metros,
-                    t.secretaria_responsavel,
-                    t.categoria,
-                    eq.id_equipamento,
-                    eq.nome_oficial,
-                    eq.nome_popular,
-                    eq.endereco.logradouro,
-                    eq.endereco.numero,
-                    eq.endereco.complemento,
-                    coalesce(eq.bairro.bairro, eq.endereco.bairro) as bairro,
-                    eq.bairro.regiao_planejamento,
-                    eq.bairro.regiao_administrativa,
-                    eq.bairro.subprefeitura,
-                    eq.contato,
-                    eq.ativo,
-                    eq.aberto_ao_publico,
-                    eq.esfera,
-                    eq.horario_funcionamento,
-                    eq.updated_at,
-                FROM tb_territorio t
-                where eq.use = TRUE 
-                and ST_WITHIN(ST_GEOGPOINT({longitude}, {latitude}), geometry)
-                __replace_categories__
-                order by eq.secretaria_responsavel, eq.categoria
-            ),
-            
-           final_tb as (
-                -- Prioridade para equipamentos do territorio
-                SELECT * 
-                FROM equipamentos_territorio
-                UNION ALL
-                -- Adiciona equipamentos da grid apenas se a categoria não existe no territorio
-                SELECT *
-                FROM equipamentos eq
-                WHERE NOT EXISTS (
-                    SELECT 1 
-                    FROM equipamentos_territorio et
-                    WHERE et.secretaria_responsavel = eq.secretaria_responsavel
-                    AND et.categoria = eq.categoria
-                )
-            )
+    latitude = coords["lat"]
+    longitude = coords["lng"]
 
-            SELECT *
-            FROM final_tb
-            order by secretaria_responsavel, categoria
-        """
-
-    if categories:
-        # logger.info(f"Categories: {categories}")
-
-        # If either "CF" or "CMS" in categories, ensure all 3 are included
-        # target_categories = ["CF", "CMS", "EQUIPE DA FAMILIA"]
-        # if any(cat in categories for cat in target_categories):
-        #     required_categories = ["CF", "CMS", "EQUIPE DA FAMILIA"]
-        #     for cat in required_categories:
-        #         if cat not in categories:
-        #             categories.append(cat)
-
-        categorias_filter = "and t.categoria in ("
-        for i in range(len(categories)):
-            if i != len(categories) - 1:
-                categorias_filter += f"'{categories[i]}', "
-            else:
-                categorias_filter += f"'{categories[i]}'"
-
-        categorias_filter += ")"
-        query = query.replace("__replace_categories__", categorias_filter)
-    else:
-        # logger.info("No categories provided. Returning all categories.")
-        query = query.replace("__replace_categories__", "")
+    # If either "CF" or "CMS" in categories, ensure all 3 are included
+    # target_categories = ["CF", "CMS", "EQUIPE DA FAMILIA"]
+    # if any(cat in categories for cat in target_categories):
+    #     required_categories = ["CF", "CMS", "EQUIPE DA FAMILIA"]
+    #     for cat in required_categories:
+    #         if cat not in categories:
+    #             categories.append(cat)
+
+    query = (
+        _PLUSCODE_EQUIPMENTS_BY_CATEGORY_QUERY
+        if categories
+        else _PLUSCODE_EQUIPMENTS_QUERY
+    )
 
     try:
         # print(query)
-        data = get_bigquery_result(query=query)
+        # Valores vão como parâmetros da query: o texto do SQL fica fixo entre
+        # chamadas e as categorias do usuário não são interpoladas no SQL.
+        query_parameters = [
+            bigquery.ScalarQueryParameter("plus8", "STRING", plus8),
+            bigquery.ScalarQueryParameter("latitude", "FLOAT64", latitude),
+            bigquery.ScalarQueryParameter("longitude", "FLOAT64", longitude),
+        ]
+        if categories:
+            query_parameters.append(
+                bigquery.ArrayQueryParameter("categories", "STRING", categories)
+            )
+        data = await _run_bigquery_query(query=query, query_parameters=query_parameters)
 
         return {
             "inputs": {
@@ -164,30 +210,7 @@ async def get_pluscode_coords_equipments(
 
 @interceptor(source={"source": "mcp", "tool": "equipments"})
 async def get_category_equipments() -> dict:
-    query = """
-        with
-        equipamentos as (
-            SELECT
-                DISTINCT
-                    TRIM(t.secretaria_responsavel) as secretaria_responsavel,
-                    TRIM(t.categoria) as categoria
-            FROM `rj-iplanrio.plus_codes.codes` t, unnest(equipamentos) as eq
-            WHERE t.categoria IS NOT NULL and eq.use = TRUE
-            UNION ALL
-            SELECT 
-            DISTINCT
-                    TRIM(t.secretaria_responsavel) as secretaria_responsavel,
-                    TRIM(t.categoria) as categoria
-            FROM `rj-iplanrio.plus_codes.territorio` t
-            WHERE t.categoria IS NOT NULL and t.equipamentos.use = TRUE
-        )
-
-    select *
-    from equipamentos eq
-    order by eq.secretaria_responsavel, eq.categoria
-    """
-
-    data = get_bigquery_result(query=query)
+    data = await _run_bigquery_query(query=_CATEGORY_EQUIPMENTS_QUERY)
     categories = {}
     for d in data:
         if d["secretaria_responsavel"] not in categories:
@@ -199,14 +222,19 @@ async def get_category_equipments() -> dict:
 
 @interceptor(source={"source": "mcp", "tool": "equipments"})
 async def get_tematic_instructions_for_equipments(tema: str = "geral") -> List[dict]:
-    where_clause = f"WHERE tema = '{tema}'" if tema != "geral" else ""
+    where_clause = "WHERE tema = @tema" if tema != "geral" else ""
     query = f"""
         SELECT 
             * 
         FROM `rj-iplanrio.plus_codes.equipamentos_instrucoes`
         {where_clause}
     """
-    data = get_bigquery_result(query=query)
+    query_parameters = (
+        [bigquery.ScalarQueryParameter("tema", "STRING", tema)]
+        if where_clause
+        else None
+    )
+    data = await _run_bigquery_query(query=query, query_parameters=query_parameters)
     return data
 
 
@@ -12,20 +12,19 @@ from src.tools.cor_alert_tools import (
 # from src.utils.log import logger
 
 
-def get_coords_from_nominatim_api(address: str) -> dict:
+async def get_coords_from_nominatim_api(address: str) -> dict:
     params = {"q": address, "format": "json", "addressdetails": 1, "limit": 1}
     headers = {"User-Agent": "RioMCPServer/1.0 (equipments@rio)"}
-    with InterceptedHTTPClient(
+    async with InterceptedHTTPClient(
         user_id="unknown",
         source={
             "source": "mcp",
             "tool": "equipments",
             "function": "get_coords_from_nominatim_api",
         },
-        sync=True,
         timeout=10.0,
     ) as client:
-        response = client.get_sync(
+        response = await client.get(
             env.NOMINATIM_API_URL, params=params, headers=headers
         )
         response.raise_for_status()
@@ -42,20 +41,19 @@ def get_coords_from_nominatim_api(address: str) -> dict:
     return {}
 
 
-def get_coords_from_google_maps_api(address: str) -> dict:
+async def get_coords_from_google_maps_api(address: str) -> dict:
     address = address + " - Rio de Janeiro, RJ"
     params = {"address": address, "key": env.GOOGLE_MAPS_API_KEY}
-    with InterceptedHTTPClient(
+    async with InterceptedHTTPClient(
         user_id="unknown",
         source={
             "source": "mcp",
             "tool": "equipments",
             "function": "get_coords_from_google_maps_api",
         },
-        sync=True,
         timeout=10.0,
     ) as client:
-        response = client.get_sync(env.GOOGLE_MAPS_API_URL, params=params)
+        response = await client.get(env.GOOGLE_MAPS_API_URL, params=params)
         data = response.json()
     if data["status"] == "OK":
         first_result = data["results"][0]
@@ -74,7 +72,9 @@ def get_coords_from_google_maps_api(address: str) -> dict:
     return {}
 
 
-def get_plus8_coords_from_address(address: str) -> Tuple[Optional[str], Optional[dict]]:
+async def get_plus8_coords_from_address(
+    address: str,
+) -> Tuple[Optional[str], Optional[dict]]:
     """Get the plus8 from an address.
 
     Args:
@@ -87,7 +87,7 @@ def get_plus8_coords_from_address(address: str) -> Tuple[Optional[str], Optional
     # coords = get_coords_from_nominatim_api(address=address)
     coords = {}
     if coords == {}:
-        coords = get_coords_from_google_maps_api(address=address)
+        coords = await get_coords_from_google_maps_api(address=address)
     if coords == {}:
         # logger.error("No coords from nominatim or google maps, returning None")
         return None, None
@@ -20,7 +20,7 @@ def get_valid_themes() -> List[str]:
     Returns:
         Lista de temas válidos configurados via variável de ambiente
     """
-    return EQUIPMENTS_VALID_THEMES
+    return list(EQUIPMENTS_VALID_THEMES)
 
 
 def get_instructions_for_equipments(equipments_data: List[dict]) -> str:
@@ -164,7 +164,7 @@ async def get_equipments_with_instructions(
             normalize_neighborhood,
         )
 
-        coords = get_coords_from_google_maps_api(address)
+        coords = await get_coords_from_google_maps_api(address)
 
         if coords:
             bairro_normalizado = coords.get("bairro_normalizado")
@@ -176,17 +176,16 @@ async def get_equipments_with_instructions(
                         "latlng": f"{coords['lat']},{coords['lng']}",
                         "key": GOOGLE_MAPS_API_KEY,
                     }
-                    with InterceptedHTTPClient(
+                    async with InterceptedHTTPClient(
                         user_id="unknown",
                         source={
                             "source": "mcp",
                             "tool": "equipments",
                             "function": "reverse_geocode",
                         },
-                        sync=True,
                         timeout=10.0,
                     ) as client:
-                        response = client.get_sync(GOOGLE_MAPS_API_URL, params=params)
+                        response = await client.get(GOOGLE_MAPS_API_URL, params=params)
                         response.raise_for_status()
                         data = response.json()
 
@@ -309,7 +308,7 @@ async def get_equipments_instructions(tema: str = "geral") -> List[dict]:
         error_response = {
             "error": "Tema inválido",
             "message": f"O tema '{tema}' não é válido. Temas válidos: {', '.join(EQUIPMENTS_VALID_THEMES)}",
-            "valid_themes": EQUIPMENTS_VALID_THEMES,
+            "valid_themes": list(EQUIPMENTS_VALID_THEMES),
             "fallback_action": "Utilizando tema 'geral' como fallback",
         }
 
@@ -542,9 +542,8 @@ def get_citations(response, resolved_urls_map):
                         # Get blacklisted domains from environment
                         blacklisted_domains = env.LINK_BLACKLIST
                         is_blacklisted = any(
-                            blacklisted_domain.strip().lower() in domain
+                            blacklisted_domain in domain
                             for blacklisted_domain in blacklisted_domains
-                            if blacklisted_domain.strip()
                         )
 
                         # Only add to citations if not blacklisted
@@ -690,9 +689,8 @@ def get_sources_list(citations_data, modified_text):
 
                 # Check if any blacklisted domain matches the source domain
                 is_blacklisted = any(
-                    blacklisted_domain.strip().lower() in domain
+                    blacklisted_domain in domain
                     for blacklisted_domain in blacklisted_domains
-                    if blacklisted_domain.strip()
                 )
 
                 if not is_blacklisted:
@@ -14,6 +14,11 @@ if env.IS_LOCAL:
 else:
     BACKEND_MODE = StateMode.REDIS
 
+# O Orchestrator não guarda estado por requisição (o StateManager e o workflow
+# são criados dentro de `execute_workflow`), então uma única instância atende
+# todas as chamadas.
+_orchestrator = Orchestrator(backend_mode=BACKEND_MODE)
+
 __all__ = [
     "multi_step_service",
     "save_workflow_graphs",
@@ -31,8 +36,7 @@ async def multi_step_service(
     )
 
     # Executa via orquestrador agnóstico (async)
-    orchestrator = Orchestrator(backend_mode=BACKEND_MODE)
-    response = await orchestrator.execute_workflow(request)
+    response = await _orchestrator.execute_workflow(request)
 
     # Retorna resposta já formatada
     return response.model_dump()
@@ -45,8 +49,7 @@ def save_workflow_graphs():
     Returns:
         Dicionário com os resultados da operação
     """
-    orchestrator = Orchestrator(backend_mode=BACKEND_MODE)
-    return orchestrator.save_all_workflow_graphs()
+    return _orchestrator.save_all_workflow_graphs()
 
 
 def save_single_workflow_graph(service_name: str):
@@ -59,5 +62,4 @@ def save_single_workflow_graph(service_name: str):
     Returns:
         Caminho para o arquivo de imagem salvo
     """
-    orchestrator = Orchestrator(backend_mode=BACKEND_MODE)
-    return orchestrator.save_workflow_graph_image(service_name)
+    return _orchestrator.save_workflow_graph_image(service_name)
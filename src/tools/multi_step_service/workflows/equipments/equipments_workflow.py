@@ -22,13 +22,13 @@ from src.tools.cor_alert_tools import (
 ALLOWED_NEIGHBORHOODS_PONTOS_APOIO = ["acari", "guaratiba", "jardim america"]
 
 
-def _geocode_and_extract_neighborhood(address: str) -> Optional[str]:
+async def _geocode_and_extract_neighborhood(address: str) -> Optional[str]:
     """
     Geocodifica endereço e extrai bairro normalizado.
     Retorna bairro normalizado ou None se não conseguir geocodificar.
     """
-    import requests
     from src.config import env
+    from src.utils.http_client import InterceptedHTTPClient
     from src.utils.log import logger
 
     # Geocodificar com Google Maps (mesma lógica que equipments já usa)
@@ -36,7 +36,16 @@ def _geocode_and_extract_neighborhood(address: str) -> Optional[str]:
     params = {"address": address_full, "key": env.GOOGLE_MAPS_API_KEY}
 
     try:
-        response = requests.get(env.GOOGLE_MAPS_API_URL, params=params, timeout=10)
+        async with InterceptedHTTPClient(
+            user_id="unknown",
+            source={
+                "source": "mcp",
+                "tool": "equipments",
+                "function": "geocode_neighborhood",
+            },
+            timeout=10.0,
+        ) as client:
+            response = await client.get(env.GOOGLE_MAPS_API_URL, params=params)
         response.raise_for_status()
         data = response.json()
 
@@ -62,7 +71,7 @@ class EquipmentsWorkflow(BaseWorkflow):
 
     service_name = "equipments_search"
     theme_payload = '{"tema": "valid_theme"}'
-    description = f"Localização de equipamentos públicos por endereço. A primeira chamada deve ser obrigatoriamente {theme_payload}, temas validos ({EQUIPMENTS_VALID_THEMES}). Esse servico pode sofrer alteracoes constantes, entao seu uso é obrigatorio memos que você ja tenha informacoes no contexto."
+    description = f"Localização de equipamentos públicos por endereço. A primeira chamada deve ser obrigatoriamente {theme_payload}, temas validos ({', '.join(EQUIPMENTS_VALID_THEMES)}). Esse servico pode sofrer alteracoes constantes, entao seu uso é obrigatorio memos que você ja tenha informacoes no contexto."
 
     @handle_errors
     async def _get_instructions(self, state: ServiceState) -> ServiceState:
@@ -181,7 +190,7 @@ class EquipmentsWorkflow(BaseWorkflow):
 
         if is_pontos_apoio:
             # Geocodificar e extrair bairro
-            bairro_normalizado = _geocode_and_extract_neighborhood(address)
+            bairro_normalizado = await _geocode_and_extract_neighborhood(address)
 
             # Verificar se bairro está na whitelist
             if (
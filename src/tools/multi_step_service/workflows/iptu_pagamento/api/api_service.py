@@ -6,7 +6,6 @@ para consulta de IPTU e geração de guias de pagamento.
 """
 
 import re
-import json
 from typing import List, Optional, Dict, Any
 import httpx
 import base64
@@ -41,6 +40,7 @@ from src.tools.multi_step_service.workflows.iptu_pagamento.pix_page_service impo
 )
 
 from loguru import logger
+from src.utils.gcp_credentials import decode_service_account_info
 from src.utils.http_client import InterceptedHTTPClient
 
 
@@ -756,7 +756,7 @@ class IPTUAPIService:
         """
         Gets credentials from env vars
         """
-        info: dict = json.loads(base64.b64decode(env.WORKFLOWS_GCP_SERVICE_ACCOUNT))
+        info = decode_service_account_info(env.WORKFLOWS_GCP_SERVICE_ACCOUNT)
         return service_account.Credentials.from_service_account_info(info)
 
     async def get_short_url(
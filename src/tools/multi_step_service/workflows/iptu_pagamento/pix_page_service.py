@@ -2,9 +2,7 @@
 Serviço para geração do link temporário da página Pix de IPTU.
 """
 
-import base64
 import datetime as dt
-import json
 import uuid
 from typing import Optional
 
@@ -17,6 +15,7 @@ from src.config import env
 from src.tools.multi_step_service.workflows.iptu_pagamento.pix_page import (
     build_pix_copy_page,
 )
+from src.utils.gcp_credentials import decode_service_account_info
 from src.utils.http_client import InterceptedHTTPClient
 
 
@@ -37,7 +36,7 @@ class IPTUPixPageService:
         self.user_id = user_id
 
     def get_credentials_from_env(self) -> service_account.Credentials:
-        info: dict = json.loads(base64.b64decode(env.WORKFLOWS_GCP_SERVICE_ACCOUNT))
+        info = decode_service_account_info(env.WORKFLOWS_GCP_SERVICE_ACCOUNT)
         return service_account.Credentials.from_service_account_info(info)
 
     def _get_workflows_gcs_bucket(self):
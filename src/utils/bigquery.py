@@ -5,7 +5,6 @@ from google.api_core.exceptions import NotFound
 from google.oauth2 import service_account
 from opentelemetry.trace import Status, StatusCode
 from typing import List
-import base64
 import json
 import src.config.env as env
 from datetime import datetime, date, time
@@ -13,6 +12,7 @@ import pytz
 from src.observability.tracing import get_tracer
 from src.utils.log import logger
 from src.utils.error_interceptor import interceptor
+from src.utils.gcp_credentials import decode_service_account_info
 from src.utils.json_utils import CustomJSONEncoder
 
 
@@ -52,7 +52,7 @@ def get_gcp_credentials(scopes: List[str] = None) -> service_account.Credentials
     Returns:
         service_account.Credentials: The GCP credentials.
     """
-    info: dict = json.loads(base64.b64decode(env.GCP_SERVICE_ACCOUNT_CREDENTIALS))
+    info = decode_service_account_info(env.GCP_SERVICE_ACCOUNT_CREDENTIALS)
     creds = service_account.Credentials.from_service_account_info(info)
     if scopes:
         creds = creds.with_scopes(scopes)
@@ -552,13 +552,18 @@ async def save_cor_alert_to_queue_background(
 
 
 @interceptor(source={"source": "mcp", "tool": "bigquery"})
-def get_bigquery_result(query: str, page_size: int = None) -> List[dict]:
+def get_bigquery_result(
+    query: str, page_size: int = None, query_parameters: List = None
+) -> List[dict]:
     """
     Executes a BigQuery query and returns results as a list of dictionaries.
 
     Args:
         query: SQL query to execute
         page_size: Number of rows per page (optional, uses env default)
+        query_parameters: BigQuery query parameters (e.g.
+            ``bigquery.ScalarQueryParameter``) bound to ``@name`` placeholders
+            in the query (optional)
 
     Returns:
         List of dictionaries with query results
@@ -574,7 +579,11 @@ def get_bigquery_result(query: str, page_size: int = None) -> List[dict]:
         span.set_attribute("bigquery.query_length", len(query))
         try:
             logger.info(f"Executando query no BigQuery: {query[:100]}...")
-            query_job = client.query(query)
+            if query_parameters:
+                job_config = bigquery.QueryJobConfig(query_parameters=query_parameters)
+                query_job = client.query(query, job_config=job_config)
+            else:
+                query_job = client.query(query)
             results = query_job.result(page_size=page_size)
 
             # Convert results to list of dictionaries
@@ -0,0 +1,18 @@
+"""Helpers para as credenciais de service account do GCP."""
+
+import base64
+import functools
+import json
+from collections.abc import Mapping
+from types import MappingProxyType
+
+
+@functools.lru_cache(maxsize=4)
+def decode_service_account_info(encoded: str) -> Mapping[str, str]:
+    """Decodifica (base64 + JSON) a service account uma única vez por valor.
+
+    O cache é indexado pelo valor bruto da variável de ambiente, então cada
+    chamada reaproveita o dicionário já parseado. A mesma instância é devolvida
+    a todos os chamadores, por isso é somente leitura.
+    """
+    return MappingProxyType(json.loads(base64.b64decode(encoded)))
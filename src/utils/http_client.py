@@ -14,6 +14,11 @@ Uso async (padrão):
     ) as client:
         response = await client.get(url, params=params)
 
+No modo async as instâncias reaproveitam um `httpx.AsyncClient` compartilhado
+pelo event loop (ver `get_shared_async_client`), mantendo conexões keep-alive
+entre chamadas em vez de refazer TCP+TLS a cada requisição. Esse cliente é
+stateless: não guarda cookies entre requisições de usuários diferentes.
+
 Uso sync:
     with InterceptedHTTPClient(
         user_id="5521999999999",
@@ -25,6 +30,8 @@ Uso sync:
 
 import asyncio
 import traceback as tb
+import weakref
+from http.cookiejar import CookieJar
 from typing import Any, Dict, Optional, Set, Union
 
 import httpx
@@ -36,6 +43,57 @@ from src.utils.error_interceptor import send_api_error
 # Status codes que devem ser interceptados por padrão
 DEFAULT_ERROR_STATUS_CODES: Set[int] = {400, 401, 403, 404, 500, 502, 503, 504}
 
+# Pool do cliente async compartilhado entre todas as tools
+SHARED_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=100, max_connections=200, keepalive_expiry=60
+)
+# Mesmo default do httpx (5s) que cada tool tinha com cliente próprio
+SHARED_CLIENT_TIMEOUT = httpx.Timeout(5.0)
+
+# Kwargs que podem ser aplicados por requisição sobre o cliente compartilhado.
+# Qualquer outro (proxy, headers, follow_redirects...) exige cliente dedicado.
+_PER_REQUEST_KWARGS = frozenset({"timeout"})
+
+# O pool de conexões fica preso ao event loop em que foi criado, então há um
+# cliente por loop; a entrada some junto com o loop (ex.: testes com
+# `asyncio.run`).
+_shared_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+class _NoCookieJar(CookieJar):
+    """CookieJar que descarta todo Set-Cookie.
+
+    O cliente compartilhado atende todos os usuários; guardar cookies de uma
+    resposta vazaria a sessão de um usuário para as requisições de outro.
+    """
+
+    def set_cookie(self, cookie):
+        pass
+
+    def extract_cookies(self, response, request):
+        pass
+
+
+def get_shared_async_client() -> httpx.AsyncClient:
+    """Retorna o `httpx.AsyncClient` compartilhado do loop atual, criando-o sob demanda."""
+    loop = asyncio.get_running_loop()
+    client = _shared_async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=SHARED_CLIENT_LIMITS,
+            timeout=SHARED_CLIENT_TIMEOUT,
+            cookies=_NoCookieJar(),
+        )
+        _shared_async_clients[loop] = client
+    return client
+
+
+async def aclose_shared_async_client() -> None:
+    """Fecha o cliente compartilhado do loop atual (chamado no shutdown do servidor)."""
+    client = _shared_async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 def raise_for_status_except(response: httpx.Response, skip_codes: Set[int]) -> None:
     """Chama raise_for_status() ignorando status codes que representam estados válidos.
@@ -93,16 +151,26 @@ class InterceptedHTTPClient:
         self.sync = sync
         self.httpx_kwargs = httpx_kwargs
         self._client: Optional[Union[httpx.Client, httpx.AsyncClient]] = None
+        self._owns_client = False
 
     # --- Async context manager ---
     async def __aenter__(self) -> "InterceptedHTTPClient":
         if self.sync:
             raise RuntimeError("Use 'with' para modo sync, não 'async with'")
-        self._client = httpx.AsyncClient(**self.httpx_kwargs)
+        if self.httpx_kwargs.keys() <= _PER_REQUEST_KWARGS:
+            self._client = get_shared_async_client()
+            self._owns_client = False
+        else:
+            self._client = httpx.AsyncClient(**self.httpx_kwargs)
+            self._owns_client = True
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._client and isinstance(self._client, httpx.AsyncClient):
+        if (
+            self._owns_client
+            and self._client
+            and isinstance(self._client, httpx.AsyncClient)
+        ):
             await self._client.aclose()
 
     # --- Sync context manager ---
@@ -203,6 +271,9 @@ class InterceptedHTTPClient:
 
         request_body = kwargs.get("json") or kwargs.get("data") or kwargs.get("params")
 
+        if not self._owns_client and "timeout" in self.httpx_kwargs:
+            kwargs.setdefault("timeout", self.httpx_kwargs["timeout"])
+
         try:
             response = await self._client.request(method, url, **kwargs)
 
@@ -6,6 +6,9 @@ from loguru import logger
 
 
 _env_cache: Dict[str, str] = {}
+# Marca se o .env já foi lido (ou se já sabemos que não existe), para que um
+# arquivo ausente ou vazio não seja procurado de novo a cada variável faltante.
+_env_loaded = False
 
 
 def _load_dotenv() -> Dict[str, str]:
@@ -14,14 +17,15 @@ def _load_dotenv() -> Dict[str, str]:
     Returns:
         Dict[str, str]: Dicionário com as variáveis do arquivo .env
     """
-    global _env_cache
+    global _env_cache, _env_loaded
 
-    if _env_cache:
+    if _env_loaded:
         return _env_cache
 
     env_path = Path(".env")
     if not env_path.exists():
-        return {}
+        _env_loaded = True
+        return _env_cache
 
     env_vars = {}
     with open(env_path, "r") as f:
@@ -44,6 +48,7 @@ def _load_dotenv() -> Dict[str, str]:
                 env_vars[key] = value
 
     _env_cache = env_vars
+    _env_loaded = True
     return env_vars
 
 
@@ -116,6 +121,36 @@ def getenv_list_or_action(
     return []
 
 
+def getenv_int_or_action(
+    env_name: str, *, action: str = "raise", default: str = None
+) -> int:
+    """Get an environment variable as an integer or raise an exception.
+
+    Args:
+        env_name (str): The name of the environment variable.
+        action (str, optional): The action to take if the environment variable is not set.
+            Defaults to "raise".
+        default (str, optional): The default value to return if the environment variable is not set.
+            Defaults to None.
+
+    Raises:
+        ValueError: If the action is invalid or the value is not a valid integer.
+
+    Returns:
+        int: The parsed value, or None if the environment variable is not set and
+            action is "warn" or "ignore".
+    """
+    value = getenv_or_action(env_name, action=action, default=default)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"Environment variable {env_name} must be an integer, got {value!r}."
+        ) from None
+
+
 def mask_string(string: str, *, mask: str = "*") -> str:
     """This function masks a string with a given mask.
     It will show a few first and last characters of the string, and mask the rest.
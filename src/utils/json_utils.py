@@ -5,10 +5,17 @@ Contém um encoder JSON seguro para tipos de data/hora, usado em qualquer ponto
 do código que precise serializar payloads potencialmente contendo objetos
 `datetime.datetime`, `datetime.date` ou `datetime.time` (por exemplo, valores
 retornados por queries no BigQuery com colunas do tipo TIMESTAMP/DATE/TIME).
+
+Também expõe `ORJSONResponse`, resposta HTTP serializada com `orjson` para as
+rotas customizadas do servidor.
 """
 
 import datetime
 import json
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
 
 
 class CustomJSONEncoder(json.JSONEncoder):
@@ -25,3 +32,15 @@ class CustomJSONEncoder(json.JSONEncoder):
 
         # Para qualquer outro tipo, deixe o encoder padrão fazer o trabalho.
         return super().default(obj)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    `JSONResponse` que serializa o conteúdo com `orjson` (datas/horas já saem
+    em ISO 8601, como no `CustomJSONEncoder`).
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -3,7 +3,7 @@ Sistema de versionamento para tools MCP
 """
 
 import json
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from pathlib import Path
 import subprocess
 from datetime import datetime
@@ -97,19 +97,24 @@ def get_tool_version_from_file() -> dict:
         return VERSION_PLACEHOLDER
 
 
-def add_tool_version(response: Any) -> Dict[str, Any]:
+def add_tool_version(
+    response: Any, version_data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Adiciona metadados de versionamento à resposta da tool.
 
     Args:
         response: Resposta original da tool
-        tool_name: Nome da tool para identificação
+        version_data: Metadados de versão já carregados. Se None, lê o
+            arquivo tool_version.json a cada chamada.
 
     Returns:
         Dict com resposta original + metadados de versão
     """
     # Usar versão armazenada no arquivo JSON
-    tool_version_data = get_tool_version_from_file()
+    tool_version_data = (
+        version_data if version_data is not None else get_tool_version_from_file()
+    )
 
     # Estruturar resposta com metadados
     versioned_response = {